@@ -0,0 +1,59 @@
+__all__ = ["ProcessHistory", "file_digest"]
+
+import sqlite3
+from hashlib import blake2b
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+
+try:
+    from typing import Self  # Python >= 3.11  # ty:ignore[unresolved-import]
+except ImportError:
+    from typing_extensions import Self  # Python < 3.11
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(filepath: Path) -> str:
+    digest = blake2b()
+    with filepath.open("rb") as stream:
+        while chunk := stream.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ProcessHistory:
+    def __init__(self, path: Path, profile: str, max_age: int = 28) -> None:
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS processed "
+            "(digest TEXT PRIMARY KEY, profile TEXT NOT NULL, day INTEGER NOT NULL)"
+        )
+        self._profile = profile
+        self._max_age = max_age
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._connection.close()
+
+    def is_processed(self, digest: str, today: int) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT profile, day FROM processed WHERE digest = ?", (digest,)
+            ).fetchone()
+        return row is not None and row[0] == self._profile and today - row[1] < self._max_age
+
+    def add(self, digest: str, day: int) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO processed (digest, profile, day) VALUES (?, ?, ?)",
+                (digest, self._profile, day),
+            )
@@ -0,0 +1,130 @@
+__all__ = ["SyncOption", "build_search", "get_services", "should_sync_metadata", "sync_metadata"]
+
+import logging
+import re
+from enum import Enum
+from functools import lru_cache
+
+from comicfn2dict import comicfn2dict
+
+from perdoo.comic.metadata import ComicInfo, MetronInfo
+from perdoo.comic.metadata.metron_info import InformationSource
+from perdoo.services import BaseService, Comicvine, Metron
+from perdoo.settings import SETTINGS, Service
+from perdoo.utils import IssueSearch, Search, SeriesSearch
+
+LOGGER = logging.getLogger(__name__)
+FILENAME_REGEX = re.compile(
+    r"^(?P<series>[^\W_][^_#()\[\]]*?)(?:\s+v\d+)?\s+#?\d+(?:\.\d+)?(?:\s+\(\d{4}\))?$"
+)
+
+
+class SyncOption(str, Enum):
+    FORCE = "Force"
+    OUTDATED = "Outdated"
+    SKIP = "Skip"
+
+    @staticmethod
+    def load(value: str) -> "SyncOption":
+        try:
+            return SYNC_OPTIONS[value.casefold()]
+        except KeyError as err:
+            raise ValueError(f"'{value}' isn't a valid SyncOption") from err
+
+    def __str__(self) -> str:
+        return self.value
+
+
+SYNC_OPTIONS: dict[str, SyncOption] = {x.value.casefold(): x for x in SyncOption}
+
+
+def get_services() -> dict[Service, BaseService]:
+    output = {}
+    if SETTINGS.services.comicvine.api_key:
+        output[Service.COMICVINE] = Comicvine(api_key=SETTINGS.services.comicvine.api_key)
+    if SETTINGS.services.metron.username and SETTINGS.services.metron.password:
+        output[Service.METRON] = Metron(
+            username=SETTINGS.services.metron.username, password=SETTINGS.services.metron.password
+        )
+    return output
+
+
+def should_sync_metadata(sync: SyncOption, metron_info: MetronInfo | None, today: int) -> bool:
+    if sync is SyncOption.SKIP:
+        return False
+    if sync is SyncOption.FORCE:
+        return True
+    if metron_info and metron_info.last_modified:
+        return today - metron_info.last_modified.toordinal() >= 28
+    return True
+
+
+def search_from_metron_info(metron_info: MetronInfo, filename: str) -> Search:
+    series_id = metron_info.series.id
+    source = None
+    ids: dict[InformationSource, str] = {}
+    for entry in metron_info.ids:
+        if entry.primary and source is None:
+            source = entry.source
+        ids.setdefault(entry.source, entry.value)
+    comicvine_id = ids.get(InformationSource.COMIC_VINE)
+    metron_id = ids.get(InformationSource.METRON)
+    return Search(
+        series=SeriesSearch(
+            name=metron_info.series.name,
+            volume=metron_info.series.volume,
+            year=metron_info.series.start_year,
+            comicvine=int(series_id)
+            if series_id and source is InformationSource.COMIC_VINE
+            else None,
+            metron=int(series_id) if series_id and source is InformationSource.METRON else None,
+        ),
+        issue=IssueSearch(
+            number=metron_info.number,
+            comicvine=int(comicvine_id) if comicvine_id else None,
+            metron=int(metron_id) if metron_id else None,
+        ),
+        filename=filename,
+    )
+
+
+def search_from_comic_info(comic_info: ComicInfo, filename: str) -> Search:
+    volume = comic_info.volume or None
+    year, volume = (volume, None) if volume and volume > 1900 else (None, volume)
+    return Search(
+        series=SeriesSearch(name=comic_info.series or filename, volume=volume, year=year),
+        issue=IssueSearch(number=comic_info.number),
+        filename=filename,
+    )
+
+
+@lru_cache(maxsize=1024)
+def parse_series_name(filename: str) -> str:
+    if match := FILENAME_REGEX.match(filename):
+        return match.group("series")
+    return str(comicfn2dict(filename).get("series", filename))
+
+
+def search_from_filename(filename: str) -> Search:
+    series_name = parse_series_name(filename=filename).replace("-", " ")
+    return Search(series=SeriesSearch(name=series_name), issue=IssueSearch(), filename=filename)
+
+
+def build_search(
+    metron_info: MetronInfo | None, comic_info: ComicInfo | None, filename: str
+) -> Search:
+    if metron_info and metron_info.series and metron_info.series.name:
+        return search_from_metron_info(metron_info=metron_info, filename=filename)
+    if comic_info and comic_info.series:
+        return search_from_comic_info(comic_info=comic_info, filename=filename)
+    return search_from_filename(filename=filename)
+
+
+def sync_metadata(
+    search: Search, services: dict[Service, BaseService], service_order: tuple[Service, ...]
+) -> tuple[MetronInfo | None, ComicInfo | None]:
+    for service_name in service_order:
+        metron_info, comic_info = services[service_name].fetch(search=search)
+        if metron_info or comic_info:
+            return metron_info, comic_info
+    return None, None
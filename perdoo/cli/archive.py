@@ -7,7 +7,6 @@ from typing import Annotated
 from typer import Argument, Option
 
 from perdoo.cli._typer import app
-from perdoo.comic import Comic
 from perdoo.console import CONSOLE
 
 LOGGER = logging.getLogger(__name__)
@@ -26,6 +25,8 @@ def archive(
         bool, Option("--skip-metron-info", help="Don't show the MetronInfo details.")
     ] = False,
 ) -> None:
+    from perdoo.comic import Comic  # noqa: PLC0415
+
     if skip_comic_info and skip_metron_info:
         return
     comic = Comic(filepath=target)
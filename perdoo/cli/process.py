@@ -1,57 +1,45 @@
+from __future__ import annotations
+
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import date
-from enum import Enum
+from functools import partial
 from io import BytesIO
+from itertools import repeat
 from pathlib import Path
 from platform import python_version
-from typing import Annotated
+from threading import Lock
+from typing import TYPE_CHECKING, Annotated, Literal
 
-from comicfn2dict import comicfn2dict
+from click import Choice
 from typer import Argument, Option
 
 from perdoo import __version__, get_cache_root, setup_logging
 from perdoo.cli._typer import app
-from perdoo.comic import Comic
-from perdoo.comic.archives import ArchiveSession
-from perdoo.comic.errors import ComicArchiveError, ComicMetadataError
-from perdoo.comic.metadata import ComicInfo, MetronInfo
-from perdoo.comic.metadata.comic_info import Page, PageType
-from perdoo.comic.metadata.metron_info import Id, InformationSource
 from perdoo.console import CONSOLE
-from perdoo.services import BaseService, Comicvine, Metron
-from perdoo.settings import SETTINGS, Service
-from perdoo.utils import (
-    IssueSearch,
-    Search,
-    SeriesSearch,
-    delete_empty_folders,
-    list_files,
-    recursive_delete,
-)
 
-LOGGER = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from perdoo.cli._history import ProcessHistory
+    from perdoo.cli._sync import SyncOption
+    from perdoo.comic import Comic
+    from perdoo.comic.archives import ArchiveSession
+    from perdoo.comic.metadata import ComicInfo, MetronInfo
+    from perdoo.services import BaseService
+    from perdoo.settings import Service
 
+LOGGER = logging.getLogger(__name__)
 
-class SyncOption(str, Enum):
-    FORCE = "Force"
-    OUTDATED = "Outdated"
-    SKIP = "Skip"
 
-
-def get_services() -> dict[Service, BaseService]:
-    output = {}
-    if SETTINGS.services.comicvine.api_key:
-        output[Service.COMICVINE] = Comicvine(api_key=SETTINGS.services.comicvine.api_key)
-    if SETTINGS.services.metron.username and SETTINGS.services.metron.password:
-        output[Service.METRON] = Metron(
-            username=SETTINGS.services.metron.username, password=SETTINGS.services.metron.password
-        )
-    return output
+SYNC_CHOICES = Choice(["Force", "Outdated", "Skip"], case_sensitive=False)
 
 
 def setup_environment(
     clean_cache: bool, sync: SyncOption, debug: bool = False
-) -> tuple[dict[Service, BaseService], SyncOption]:
+) -> tuple[dict[Service, BaseService], SyncOption, tuple[Service, ...]]:
+    from perdoo.cli._sync import SyncOption, get_services  # noqa: PLC0415
+    from perdoo.settings import SETTINGS  # noqa: PLC0415
+    from perdoo.utils import recursive_delete  # noqa: PLC0415
+
     setup_logging(debug=debug)
     LOGGER.info("Python v%s", python_version())
     LOGGER.info("Perdoo v%s", __version__)
@@ -64,116 +52,76 @@ def setup_environment(
     if not services and sync is not SyncOption.SKIP:
         LOGGER.warning("No external services configured")
         sync = SyncOption.SKIP
-    return services, sync
+    service_order = tuple(x for x in SETTINGS.services.order if x in services)
+    return services, sync, service_order
 
 
-def load_comics(target: Path) -> list[Comic]:
-    comics = []
-    files = list_files(target) if target.is_dir() else [target]
-    for file in files:
-        try:
-            comics.append(Comic(filepath=file))
-        except (ComicArchiveError, ComicMetadataError) as err:  # noqa: PERF203
-            LOGGER.error("Failed to load '%s' as a Comic: %s", file, err)
-    return comics
+def load_comic(filepath: Path) -> Comic | None:
+    from perdoo.comic import Comic  # noqa: PLC0415
+    from perdoo.comic.errors import ComicArchiveError, ComicMetadataError  # noqa: PLC0415
 
-
-def prepare_comic(entry: Comic, skip_convert: bool) -> bool:
-    if not skip_convert:
-        entry.convert_to(SETTINGS.output.format)
-    if not entry.archive.IS_WRITEABLE:
-        LOGGER.warning("Archive format %s is not writeable", entry.archive.EXTENSION)
-        return False
-    return True
+    try:
+        return Comic(filepath=filepath)
+    except (ComicArchiveError, ComicMetadataError) as err:
+        LOGGER.error("Failed to load '%s' as a Comic: %s", filepath, err)
+    return None
 
 
-def should_sync_metadata(sync: SyncOption, metron_info: MetronInfo | None) -> bool:
-    if sync is SyncOption.SKIP:
-        return False
-    if sync is SyncOption.FORCE:
-        return True
-    if metron_info and metron_info.last_modified:
-        age = (date.today() - metron_info.last_modified.date()).days
-        return age >= 28
-    return True
+def load_comics(target: Path) -> list[Comic]:
+    from natsort import humansorted, ns  # noqa: PLC0415
 
+    from perdoo.comic.archives import Archive  # noqa: PLC0415
+    from perdoo.utils import iter_files  # noqa: PLC0415
 
-def get_id(ids: list[Id], source: InformationSource) -> str | None:
-    return next((x.value for x in ids if x.source is source), None)
-
-
-def search_from_metron_info(metron_info: MetronInfo, filename: str) -> Search:
-    series_id = metron_info.series.id
-    comicvine_id = get_id(metron_info.ids, InformationSource.COMIC_VINE)
-    metron_id = get_id(metron_info.ids, InformationSource.METRON)
-    source = next((x.source for x in metron_info.ids if x.primary), None)
-    return Search(
-        series=SeriesSearch(
-            name=metron_info.series.name,
-            volume=metron_info.series.volume,
-            year=metron_info.series.start_year,
-            comicvine=int(series_id)
-            if series_id and source == InformationSource.COMIC_VINE
-            else None,
-            metron=int(series_id) if series_id and source == InformationSource.METRON else None,
-        ),
-        issue=IssueSearch(
-            number=metron_info.number,
-            comicvine=int(comicvine_id) if comicvine_id else None,
-            metron=int(metron_id) if metron_id else None,
-        ),
-        filename=filename,
-    )
+    files = iter_files(target, *Archive.supported_extensions()) if target.is_dir() else [target]
+    with ThreadPoolExecutor() as executor:
+        comics = [x for x in executor.map(load_comic, files) if x]
+    return humansorted(comics, key=lambda x: x.filepath, alg=ns.NA | ns.G | ns.P)
 
 
-def search_from_comic_info(comic_info: ComicInfo, filename: str) -> Search:
-    volume = comic_info.volume
-    year = volume if volume and volume > 1900 else None
-    volume = volume if volume and volume < 1900 else None
-    return Search(
-        series=SeriesSearch(name=comic_info.series or filename, volume=volume, year=year),
-        issue=IssueSearch(number=comic_info.number),
-        filename=filename,
-    )
+def convert_comic(filepath: Path, extension: Literal["cbz", "cbt", "cb7"]) -> Path:
+    from perdoo.comic import Comic  # noqa: PLC0415
 
+    entry = Comic(filepath=filepath)
+    entry.convert_to(extension)
+    return entry.filepath
 
-def search_from_filename(filename: str) -> Search:
-    series_name = comicfn2dict(filename).get("series", filename)
-    series_name = str(series_name).replace("-", " ")
-    return Search(series=SeriesSearch(name=series_name), issue=IssueSearch(), filename=filename)
 
+def convert_comics(
+    comics: list[Comic], extension: Literal["cbz", "cbt", "cb7"], jobs: int
+) -> list[Comic]:
+    from perdoo.comic import Comic  # noqa: PLC0415
 
-def build_search(
-    metron_info: MetronInfo | None, comic_info: ComicInfo | None, filename: str
-) -> Search:
-    if metron_info and metron_info.series and metron_info.series.name:
-        return search_from_metron_info(metron_info=metron_info, filename=filename)
-    if comic_info and comic_info.series:
-        return search_from_comic_info(comic_info=comic_info, filename=filename)
-    return search_from_filename(filename=filename)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        filepaths = executor.map(convert_comic, [x.filepath for x in comics], repeat(extension))
+        return [Comic(filepath=x) for x in filepaths]
 
 
-def sync_metadata(
-    search: Search, services: dict[Service, BaseService], service_order: tuple[Service, ...]
-) -> tuple[MetronInfo | None, ComicInfo | None]:
-    for service_name in service_order:
-        if service := services.get(service_name):
-            metron_info, comic_info = service.fetch(search=search)
-            if metron_info or comic_info:
-                return metron_info, comic_info
-    return None, None
+def prepare_comic(entry: Comic, skip_convert: bool) -> bool:
+    if skip_convert and not entry.archive.IS_WRITEABLE:
+        LOGGER.warning("Archive format %s is not writeable", entry.archive.EXTENSION)
+        return False
+    return True
 
 
 def resolve_metadata(
-    entry: Comic, session: ArchiveSession, services: dict[Service, BaseService], sync: SyncOption
+    *,
+    entry: Comic,
+    metron_info: MetronInfo | None,
+    comic_info: ComicInfo | None,
+    services: dict[Service, BaseService],
+    service_order: tuple[Service, ...],
+    sync: SyncOption,
+    today: int,
 ) -> tuple[MetronInfo | None, ComicInfo | None]:
-    metron_info, comic_info = entry.read_metadata(session=session)
-    if not should_sync_metadata(sync=sync, metron_info=metron_info):
+    from perdoo.cli._sync import build_search, should_sync_metadata, sync_metadata  # noqa: PLC0415
+
+    if not should_sync_metadata(sync=sync, metron_info=metron_info, today=today):
         return metron_info, comic_info
     search = build_search(
         metron_info=metron_info, comic_info=comic_info, filename=entry.filepath.stem
     )
-    return sync_metadata(search=search, services=services, service_order=SETTINGS.services.order)
+    return sync_metadata(search=search, services=services, service_order=service_order)
 
 
 def generate_naming(metron_info: MetronInfo | None, comic_info: ComicInfo | None) -> str | None:
@@ -188,10 +136,18 @@ def generate_naming(metron_info: MetronInfo | None, comic_info: ComicInfo | None
 def load_page_info(entry: Comic, session: ArchiveSession, comic_info: ComicInfo) -> None:
     from PIL import Image  # noqa: PLC0415
 
-    pages = set()
+    from perdoo.comic.metadata.comic_info import Page, PageType  # noqa: PLC0415
+    from perdoo.settings import SETTINGS  # noqa: PLC0415
+
+    pages = {}
     image_files = entry.list_images(image_extensions=SETTINGS.output.image_extensions)
-    for idx, file in enumerate(image_files):
-        page = next((x for x in comic_info.pages if x.image == idx), None)
+    indices = {x.name: idx for idx, x in enumerate(image_files)}
+    pages_by_index = {x.image: x for x in reversed(comic_info.pages)}
+    for filename, page_bytes in entry.iter_files(session=session, filenames=list(indices)):
+        if not page_bytes:
+            continue
+        idx = indices[filename]
+        page = pages_by_index.get(idx)
         if page:
             page_type = page.type
         elif idx == 0:
@@ -203,28 +159,30 @@ def load_page_info(entry: Comic, session: ArchiveSession, comic_info: ComicInfo)
         if not page:
             page = Page(image=idx)
         page.type = page_type
-        page_bytes = entry.read_file(session=session, filename=file.name)
-        if not page_bytes:
-            continue
         page.image_size = len(page_bytes)
         with Image.open(BytesIO(page_bytes)) as page_data:
             width, height = page_data.size
             page.double_page = width >= height
             page.image_height = height
             page.image_width = width
-        pages.add(page)
-    comic_info.pages = sorted(pages)
+        pages[idx] = page
+    comic_info.pages = [pages[x] for x in sorted(pages)]
 
 
 def apply_changes(
+    *,
     entry: Comic,
     session: ArchiveSession,
     metron_info: MetronInfo | None,
     comic_info: ComicInfo | None,
+    local_metron_info: MetronInfo | None,
+    local_comic_info: ComicInfo | None,
     skip_clean: bool,
     skip_rename: bool,
 ) -> str | None:
-    local_metron_info, local_comic_info = entry.read_metadata(session=session)
+    from perdoo.comic.metadata import ComicInfo, MetronInfo  # noqa: PLC0415
+    from perdoo.settings import SETTINGS  # noqa: PLC0415
+
     if local_metron_info != metron_info:
         if metron_info:
             session.write(filename=MetronInfo.FILENAME, data=metron_info.to_bytes())
@@ -232,6 +190,8 @@ def apply_changes(
             session.delete(filename=MetronInfo.FILENAME)
 
     if comic_info and SETTINGS.output.comic_info.handle_pages:
+        if comic_info is local_comic_info:
+            comic_info = comic_info.model_copy(deep=True)
         load_page_info(entry=entry, session=session, comic_info=comic_info)
     if local_comic_info != comic_info:
         if comic_info:
@@ -249,14 +209,85 @@ def apply_changes(
     ):
         images = entry.list_images(image_extensions=SETTINGS.output.image_extensions)
         stem = Path(naming).stem
-        pad = len(str(len(images)))
+        index_format = f"0{len(str(len(images)))}d"
         for idx, img in enumerate(images):
-            new_name = f"{stem}_{str(idx).zfill(pad)}{img.suffix}"
+            new_name = f"{stem}_{idx:{index_format}}{img.suffix}"
             if img.name != new_name:
                 session.rename(filename=img.name, new_name=new_name)
     return naming
 
 
+def history_profile(
+    sync: SyncOption, skip_convert: bool, skip_clean: bool, skip_rename: bool
+) -> str:
+    from hashlib import blake2b  # noqa: PLC0415
+
+    from perdoo.settings import SETTINGS  # noqa: PLC0415
+
+    return blake2b(
+        f"{SETTINGS.model_dump_json()}|{sync}|{skip_convert}|{skip_clean}|{skip_rename}".encode()
+    ).hexdigest()
+
+
+def process_comic(
+    *,
+    entry: Comic,
+    history: ProcessHistory,
+    services: dict[Service, BaseService],
+    service_order: tuple[Service, ...],
+    sync: SyncOption,
+    today: int,
+    skip_convert: bool,
+    skip_clean: bool,
+    skip_rename: bool,
+    extract_workers: int,
+    lock: Lock,
+) -> None:
+    from perdoo.cli._history import file_digest  # noqa: PLC0415
+    from perdoo.cli._sync import SyncOption  # noqa: PLC0415
+    from perdoo.settings import SETTINGS  # noqa: PLC0415
+
+    if sync is not SyncOption.FORCE and history.is_processed(
+        digest=file_digest(filepath=entry.filepath), today=today
+    ):
+        LOGGER.info("'%s' is unchanged since it was last processed", entry.filepath.name)
+        return
+    if not prepare_comic(entry=entry, skip_convert=skip_convert):
+        return
+    with entry.open_session(
+        extension=None if skip_convert else SETTINGS.output.format, workers=extract_workers
+    ) as session:
+        local_metron_info, local_comic_info = entry.read_metadata(session=session)
+        metron_info, comic_info = resolve_metadata(
+            entry=entry,
+            metron_info=local_metron_info,
+            comic_info=local_comic_info,
+            services=services,
+            service_order=service_order,
+            sync=sync,
+            today=today,
+        )
+        naming = apply_changes(
+            entry=entry,
+            session=session,
+            metron_info=metron_info,
+            comic_info=comic_info,
+            local_metron_info=local_metron_info,
+            local_comic_info=local_comic_info,
+            skip_clean=skip_clean,
+            skip_rename=skip_rename,
+        )
+    if naming:
+        with lock:
+            entry.move_to(naming=naming, output_folder=SETTINGS.output.folder)
+    if sync is SyncOption.SKIP:
+        history.add(digest=file_digest(filepath=entry.filepath), day=today)
+    elif metron_info and metron_info.last_modified:
+        history.add(
+            digest=file_digest(filepath=entry.filepath), day=metron_info.last_modified.toordinal()
+        )
+
+
 @app.command(help="Process comics by converting, syncing metadata, and organizing them.")
 def process(
     target: Annotated[
@@ -269,14 +300,14 @@ def process(
         bool, Option("--skip-convert", help="Skip converting comics to the configured format.")
     ] = False,
     sync: Annotated[
-        SyncOption,
+        str,
         Option(
             "--sync",
             "-s",
-            case_sensitive=False,
+            click_type=SYNC_CHOICES,
             help="Sync ComicInfo/MetronInfo with online services.",
         ),
-    ] = SyncOption.OUTDATED,
+    ] = "Outdated",
     skip_clean: Annotated[
         bool, Option("--skip-clean", help="Skip removing any non-image/MetronInfo/ComicInfo files.")
     ] = False,
@@ -293,32 +324,71 @@ def process(
     debug: Annotated[
         bool, Option("--debug", help="Enable debug mode to show extra information.")
     ] = False,
+    jobs: Annotated[
+        int,
+        Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Number of comics to convert in parallel, "
+            "and to process in parallel when syncing is skipped, "
+            "otherwise the number of threads used to extract each comic.",
+        ),
+    ] = 1,
 ) -> None:
-    services, sync = setup_environment(clean_cache=clean_cache, sync=sync, debug=debug)
+    from perdoo.cli._history import ProcessHistory  # noqa: PLC0415
+    from perdoo.cli._sync import SyncOption  # noqa: PLC0415
+    from perdoo.settings import SETTINGS  # noqa: PLC0415
+    from perdoo.utils import delete_empty_folders  # noqa: PLC0415
 
+    services, sync_option, service_order = setup_environment(
+        clean_cache=clean_cache, sync=SyncOption.load(value=sync), debug=debug
+    )
+
+    profile = history_profile(
+        sync=sync_option, skip_convert=skip_convert, skip_clean=skip_clean, skip_rename=skip_rename
+    )
     comics = load_comics(target=target)
+    if not skip_convert and jobs > 1:
+        with CONSOLE.status(f"Converting {len(comics)} comics using {jobs} jobs"):
+            comics = convert_comics(comics=comics, extension=SETTINGS.output.format, jobs=jobs)
+        skip_convert = True
     total = len(comics)
-    for index, entry in enumerate(comics, start=1):
-        CONSOLE.rule(
-            f"[{index}/{total}] Importing {entry.filepath.name}", align="left", style="subtitle"
-        )
-
-        if not prepare_comic(entry=entry, skip_convert=skip_convert):
-            continue
-        with entry.open_session() as session:
-            metron_info, comic_info = resolve_metadata(
-                entry=entry, session=session, services=services, sync=sync
-            )
-            naming = apply_changes(
-                entry=entry,
-                session=session,
-                metron_info=metron_info,
-                comic_info=comic_info,
-                skip_clean=skip_clean,
-                skip_rename=skip_rename,
-            )
-        if naming:
-            entry.move_to(naming=naming, output_folder=SETTINGS.output.folder)
+    parallel = jobs > 1 and sync_option is SyncOption.SKIP
+    worker = partial(
+        process_comic,
+        services=services,
+        service_order=service_order,
+        sync=sync_option,
+        today=date.today().toordinal(),
+        skip_convert=skip_convert,
+        skip_clean=skip_clean,
+        skip_rename=skip_rename,
+        extract_workers=1 if parallel else jobs,
+        lock=Lock(),
+    )
+    with ProcessHistory(path=get_cache_root() / "history.sqlite", profile=profile) as history:
+        if parallel:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = {
+                    executor.submit(worker, entry=entry, history=history): entry.filepath.name
+                    for entry in comics
+                }
+                for index, future in enumerate(as_completed(futures), start=1):
+                    future.result()
+                    CONSOLE.rule(
+                        f"[{index}/{total}] Processed {futures[future]}",
+                        align="left",
+                        style="subtitle",
+                    )
+        else:
+            for index, entry in enumerate(comics, start=1):
+                CONSOLE.rule(
+                    f"[{index}/{total}] Importing {entry.filepath.name}",
+                    align="left",
+                    style="subtitle",
+                )
+                worker(entry=entry, history=history)
     with CONSOLE.status("Cleaning up empty folders"):
         delete_empty_folders(folder=target)
 
@@ -339,14 +409,14 @@ def run(
         bool, Option("--skip-convert", help="Skip converting comics to the configured format.")
     ] = False,
     sync: Annotated[
-        SyncOption,
+        str,
         Option(
             "--sync",
             "-s",
-            case_sensitive=False,
+            click_type=SYNC_CHOICES,
             help="Sync ComicInfo/MetronInfo with online services.",
         ),
-    ] = SyncOption.OUTDATED,
+    ] = "Outdated",
     skip_clean: Annotated[
         bool,
         Option(
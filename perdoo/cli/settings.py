@@ -1,9 +1,10 @@
 __all__ = []
 
 from perdoo.cli._typer import app
-from perdoo.settings import SETTINGS
 
 
 @app.command(help="Display app settings and defaults.")
 def settings() -> None:
+    from perdoo.settings import SETTINGS  # noqa: PLC0415
+
     SETTINGS.display()
@@ -1,8 +1,11 @@
-__all__ = ["Archive"]
+__all__ = ["COMPRESSED_EXTENSIONS", "COPY_BUFSIZE", "Archive"]
 
+import shutil
 from abc import ABC, abstractmethod
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import ClassVar
+from typing import IO, ClassVar, Final
 
 from perdoo.comic.errors import ComicArchiveError
 
@@ -11,42 +14,123 @@ try:
 except ImportError:
     from typing_extensions import Self  # Python < 3.11
 
+COMPRESSED_EXTENSIONS: Final[frozenset[str]] = frozenset(
+    [".avif", ".gif", ".jpeg", ".jpg", ".jxl", ".png", ".webp"]
+)
+COPY_BUFSIZE: Final[int] = 1 << 20
+SHM_FOLDER: Final[Path] = Path("/dev/shm")  # noqa: S108
+
 
 class Archive(ABC):
-    _registry: ClassVar[list[type["Archive"]]] = []
+    _registry: ClassVar[dict[str, type["Archive"]]] = {}
     EXTENSION: ClassVar[str] = ""
+    MAGIC: ClassVar[bytes] = b""
+    MAGIC_OFFSET: ClassVar[int] = 0
     IS_READABLE: ClassVar[bool] = False
     IS_WRITEABLE: ClassVar[bool] = False
     IS_EDITABLE: ClassVar[bool] = False
+    IS_STREAMABLE: ClassVar[bool] = False
 
     def __init__(self, filepath: Path) -> None:
         self._filepath = filepath
+        self._batching = False
+        self._filenames: list[str] | None = None
+        self._nameset: frozenset[str] | None = None
 
     def __init_subclass__(cls, **kwargs) -> None:  # noqa: ANN003
         super().__init_subclass__(**kwargs)
-        Archive._registry.append(cls)
+        Archive._registry[cls.EXTENSION] = cls
 
     @property
     def filepath(self) -> Path:
         return self._filepath
 
+    def scratch_folder(self) -> Path:
+        try:
+            if shutil.disk_usage(SHM_FOLDER).free > self.filepath.stat().st_size * 4:
+                return SHM_FOLDER
+        except OSError:
+            pass
+        return self.filepath.parent
+
     @classmethod
     def load(cls, filepath: Path) -> Self:
-        for _cls in cls._registry:
-            if _cls.is_archive(filepath):
-                return _cls(filepath=filepath)
+        _cls = cls._registry.get(filepath.suffix.lower())
+        if _cls and _cls.is_archive(filepath):
+            return _cls(filepath=filepath)
         raise ComicArchiveError(f"Unsupported archive format: {filepath.suffix.lower()}")
 
+    @classmethod
+    def supported_extensions(cls) -> tuple[str, ...]:
+        return tuple(cls._registry)
+
     @classmethod
     @abstractmethod
     def is_archive(cls, path: Path) -> bool: ...
 
+    @classmethod
+    def has_magic(cls, path: Path) -> bool:
+        if not cls.MAGIC:
+            return False
+        try:
+            with path.open("rb") as stream:
+                stream.seek(cls.MAGIC_OFFSET)
+                return stream.read(len(cls.MAGIC)) == cls.MAGIC
+        except OSError:
+            return False
+
+    @contextmanager
+    def batch(self) -> Generator[None]:
+        if self._batching:
+            yield
+            return
+        self._batching = True
+        commit = False
+        try:
+            yield
+            commit = True
+        finally:
+            self._batching = False
+            self._reset_filenames()
+            self._close(commit=commit)
+
+    def _close(self, commit: bool) -> None:  # noqa: B027
+        pass
+
+    def list_filenames(self) -> list[str]:
+        if self._filenames is None:
+            filenames = self._list_filenames()
+            if not self._batching:
+                return filenames
+            self._filenames = filenames
+        return list(self._filenames)
+
     @abstractmethod
-    def list_filenames(self) -> list[str]: ...
+    def _list_filenames(self) -> list[str]: ...
+
+    def _reset_filenames(self) -> None:
+        self._filenames = None
+        self._nameset = None
+
+    def exists(self, filename: str) -> bool:
+        if self._nameset is None:
+            nameset = frozenset(self.list_filenames())
+            if not self._batching:
+                return filename in nameset
+            self._nameset = nameset
+        return filename in self._nameset
 
     def read_file(self, filename: str) -> bytes:
         raise ComicArchiveError(f"Unable to read {filename} from {self.filepath.name}.")
 
+    def read_files(self, filenames: list[str]) -> dict[str, bytes]:
+        return dict(self.iter_files(filenames=filenames))
+
+    def iter_files(self, filenames: list[str]) -> Iterator[tuple[str, bytes]]:
+        with self.batch():
+            for filename in filenames:
+                yield filename, self.read_file(filename=filename)
+
     def write_file(self, filename: str, data: bytes) -> None:  # noqa: ARG002
         raise ComicArchiveError(f"Unable to write {filename} to {self.filepath.name}.")
 
@@ -58,11 +142,29 @@ class Archive(ABC):
             f"Unable to rename {filename} to {new_name} in {self.filepath.name}."
         )
 
+    def iter_members(self) -> Iterator[tuple[str, int, float, IO[bytes]]]:
+        raise ComicArchiveError(f"Unable to stream files from {self.filepath.name}.")
+
     @abstractmethod
-    def extract_files(self, destination: Path) -> None: ...
+    def extract_files(self, destination: Path, workers: int = 1) -> None: ...
+
+    @classmethod
+    def archive_files(
+        cls,
+        src: Path,  # noqa: ARG003
+        output_name: str,
+        files: list[Path],  # noqa: ARG003
+        output_folder: Path | None = None,  # noqa: ARG003
+    ) -> Path:
+        raise ComicArchiveError(f"Unable to archive files to {output_name}{cls.EXTENSION}.")
 
     @classmethod
-    def archive_files(cls, src: Path, output_name: str, files: list[Path]) -> Path:  # noqa: ARG003
+    def archive_members(
+        cls,
+        folder: Path,  # noqa: ARG003
+        output_name: str,
+        members: Iterator[tuple[str, int, float, IO[bytes]]],  # noqa: ARG003
+    ) -> Path:
         raise ComicArchiveError(f"Unable to archive files to {output_name}{cls.EXTENSION}.")
 
     @classmethod
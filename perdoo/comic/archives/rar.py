@@ -1,6 +1,8 @@
 __all__ = ["CBRArchive"]
 
 import logging
+from collections.abc import Generator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import ClassVar
 
@@ -14,33 +16,53 @@ LOGGER = logging.getLogger(__name__)
 
 class CBRArchive(Archive):
     EXTENSION: ClassVar[str] = ".cbr"
+    MAGIC: ClassVar[bytes] = b"Rar!\x1a\x07"
     IS_READABLE: ClassVar[bool] = True
     IS_WRITEABLE: ClassVar[bool] = False
     IS_EDITABLE: ClassVar[bool] = False
 
+    def __init__(self, filepath: Path) -> None:
+        super().__init__(filepath=filepath)
+        self._handle: RarFile | None = None
+
     @classmethod
     def is_archive(cls, path: Path) -> bool:
         if path.suffix.lower() != cls.EXTENSION:
             return False
-        return is_rarfile(xfile=path)
+        return cls.has_magic(path=path) or is_rarfile(xfile=path)
+
+    @contextmanager
+    def _reader(self) -> Generator[RarFile]:
+        if self._batching:
+            if self._handle is None:
+                self._handle = RarFile(file=self.filepath, mode="r")
+            yield self._handle
+            return
+        with RarFile(file=self.filepath, mode="r") as archive:
+            yield archive
+
+    def _close(self, commit: bool) -> None:  # noqa: ARG002
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            handle.close()
 
-    def list_filenames(self) -> list[str]:
+    def _list_filenames(self) -> list[str]:
         try:
-            with RarFile(file=self.filepath, mode="r") as archive:
+            with self._reader() as archive:
                 return archive.namelist()
         except Exception as err:
             raise ComicArchiveError(f"Unable to list files in {self.filepath.name}") from err
 
     def read_file(self, filename: str) -> bytes:
         try:
-            with RarFile(file=self.filepath, mode="r") as archive:
+            with self._reader() as archive:
                 return archive.read(filename)
         except Exception as err:
             raise ComicArchiveError(f"Unable to read {filename} in {self.filepath.name}.") from err
 
-    def extract_files(self, destination: Path) -> None:
+    def extract_files(self, destination: Path, workers: int = 1) -> None:  # noqa: ARG002
         try:
-            with RarFile(file=self.filepath, mode="r") as archive:
+            with self._reader() as archive:
                 archive.extractall(path=destination)
         except Exception as err:
             raise ComicArchiveError(f"Unable to extract files from {self.filepath.name}.") from err
@@ -2,6 +2,8 @@ __all__ = ["ArchiveSession"]
 
 import logging
 import shutil
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from types import TracebackType
@@ -20,27 +22,49 @@ LOGGER = logging.getLogger(__name__)
 
 
 class ArchiveSession:
-    def __init__(self, archive: Archive) -> None:
+    def __init__(
+        self, archive: Archive, output: type[Archive] | None = None, workers: int = 1
+    ) -> None:
         self._archive = archive
+        self._output = output if output and not isinstance(archive, output) else None
+        self._editable = archive.IS_EDITABLE and self._output is None
+        self._batch = ExitStack()
         self._temp_dir: TemporaryDirectory | None = None
         self._folder: Path | None = None
         self._extracted = False
         self._updated = False
+        self._depth = 0
+        self._workers = workers
+
+    @property
+    def archive(self) -> Archive:
+        return self._archive
 
     def __enter__(self) -> Self:
-        if self._archive.IS_EDITABLE:
+        self._depth += 1
+        if self._depth > 1:
             return self
+        self._batch.enter_context(self._archive.batch())
+        if self._editable or (self._output is None and self._archive.IS_READABLE):
+            return self
+        self._extract()
+        return self
 
-        self._temp_dir = TemporaryDirectory()
-        self._folder = Path(self._temp_dir.name)
+    def _extract(self) -> Path:
+        self._temp_dir = TemporaryDirectory(
+            prefix=f"{self._archive.filepath.stem}_", dir=self._archive.scratch_folder()
+        )
+        self._folder = Path(self._temp_dir.name) / self._archive.filepath.stem
         with CONSOLE.status(
             f"Extracting '{self._archive.filepath}' to '{self._folder}'",
             spinner="simpleDotsScrolling",
         ):
-            self._archive.extract_files(destination=self._folder)
+            self._archive.extract_files(destination=self._folder, workers=self._workers)
+            if self._output:
+                self._flatten()
         self._extracted = True
-        self._updated = False
-        return self
+        self._updated = self._output is not None
+        return self._folder
 
     def __exit__(
         self,
@@ -48,76 +72,112 @@ class ArchiveSession:
         exc: BaseException | None,
         tb: TracebackType | None,
     ) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
         try:
+            self._batch.__exit__(exc_type, exc, tb)
             if exc_type is None and self._extracted and self._updated:
                 with CONSOLE.status(
                     f"Archiving '{self._folder}' to '{self._archive.filepath}'",
                     spinner="simpleDotsScrolling",
                 ):
                     if self._folder:
-                        filepath = self._archive.archive_files(
-                            src=self._folder,
-                            output_name=self._archive.filepath.stem,
-                            files=list_files(path=self._folder),
-                        )
-                        self._archive.filepath.unlink(missing_ok=True)
-                        shutil.move(filepath, self._archive.filepath)
+                        self._repack(folder=self._folder)
         finally:
             if self._temp_dir:
                 self._temp_dir.cleanup()
             self._folder = None
             self._extracted = False
 
+    def _repack(self, folder: Path) -> None:
+        output = self._output or type(self._archive)
+        with TemporaryDirectory(
+            prefix=f"{self._archive.filepath.stem}_", dir=self._archive.filepath.parent
+        ) as temp_str:
+            filepath = output.archive_files(
+                src=folder,
+                output_name=self._archive.filepath.stem,
+                files=list_files(path=folder),
+                output_folder=Path(temp_str),
+            )
+            new_filepath = self._archive.filepath.with_suffix(output.EXTENSION)
+            filepath.replace(new_filepath)
+        if new_filepath != self._archive.filepath:
+            self._archive.filepath.unlink(missing_ok=True)
+        self._archive = output(filepath=new_filepath)
+
+    def _flatten(self) -> None:
+        if not self._folder:
+            return
+        for file in list_files(path=self._folder):
+            if file.parent != self._folder:
+                file.rename(self._folder / file.name)
+        for entry in self._folder.iterdir():
+            if entry.is_dir():
+                shutil.rmtree(entry)
+
     def list(self) -> list[str]:
-        if self._archive.IS_EDITABLE:
+        if self._folder:
+            return [p.name for p in self._folder.iterdir()]
+        if self._archive.IS_READABLE:
             return self._archive.list_filenames()
-        if not self._folder:
-            return []
-        return [p.name for p in self._folder.iterdir()]
+        return []
 
     def contains(self, filename: str) -> bool:
-        return filename in self.list()
+        if self._folder:
+            return (self._folder / filename).exists()
+        if self._archive.IS_READABLE:
+            return self._archive.exists(filename=filename)
+        return False
 
     def read(self, filename: str) -> bytes:
+        if self._folder:
+            return (self._folder / filename).read_bytes()
         if self._archive.IS_READABLE:
             return self._archive.read_file(filename=filename)
-        if not self._folder:
-            return b""
-        return (self._folder / filename).read_bytes()
+        return b""
+
+    def read_files(self, filenames: Iterable[str]) -> dict[str, bytes]:
+        return dict(self.iter_files(filenames=filenames))
+
+    def iter_files(self, filenames: Iterable[str]) -> Iterator[tuple[str, bytes]]:
+        if self._folder:
+            for filename in filenames:
+                yield filename, (self._folder / filename).read_bytes()
+        elif self._archive.IS_READABLE:
+            yield from self._archive.iter_files(filenames=list(filenames))
 
     def write(self, filename: str, data: str | bytes) -> None:
         LOGGER.info("Writing '%s'", filename)
         if isinstance(data, str):
             data = data.encode("UTF-8")
-        if self._archive.IS_EDITABLE:
+        if self._editable:
             self._archive.write_file(filename=filename, data=data)
         else:
-            if not self._folder:
-                return
-            (self._folder / filename).write_bytes(data)
+            folder = self._folder or self._extract()
+            (folder / filename).write_bytes(data)
         self._updated = True
 
     def delete(self, filename: str) -> None:
         LOGGER.info("Deleting '%s'", filename)
-        if self._archive.IS_EDITABLE:
+        if self._editable:
             self._archive.delete_file(filename=filename)
         else:
-            if not self._folder:
-                return
-            (self._folder / filename).unlink(missing_ok=True)
+            folder = self._folder or self._extract()
+            (folder / filename).unlink(missing_ok=True)
         self._updated = True
 
     def rename(self, filename: str, new_name: str, override: bool = False) -> None:
         LOGGER.info("Renaming '%s' to '%s'", filename, new_name)
-        if self._archive.IS_EDITABLE:
+        if self._editable:
             self._archive.rename_file(filename=filename, new_name=new_name, override=override)
         else:
-            if not self._folder:
-                return
-            src = self._folder / filename
+            folder = self._folder or self._extract()
+            src = folder / filename
             if not src.exists():
                 raise ComicArchiveError(f"Unable to rename '{src}' as it does not exist.")
-            dest = self._folder / new_name
+            dest = folder / new_name
             if dest.exists() and not override:
                 raise ComicArchiveError(f"Unable to rename '{src}' as '{dest}' already exists.")
             shutil.move(src, dest)
@@ -1,13 +1,14 @@
 __all__ = ["PY7ZR_AVAILABLE", "CB7Archive"]
 
 import logging
-import shutil
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from sys import maxsize
 from tempfile import TemporaryDirectory
 from typing import ClassVar
 
-from perdoo.comic.archives._base import Archive
+from perdoo.comic.archives._base import COMPRESSED_EXTENSIONS, Archive
 from perdoo.comic.errors import ComicArchiveError
 from perdoo.utils import list_files
 
@@ -27,33 +28,68 @@ except ImportError:
 LOGGER = logging.getLogger(__name__)
 
 
+def _select_filters(files: list[Path]) -> list[dict[str, int]]:
+    total = compressed = 0
+    for file in files:
+        size = file.stat().st_size
+        total += size
+        if file.suffix.lower() in COMPRESSED_EXTENSIONS:
+            compressed += size
+    if compressed * 10 >= total * 9:
+        return [{"id": py7zr.FILTER_COPY}]
+    return [{"id": py7zr.FILTER_LZMA2, "preset": 1}]
+
+
 class CB7Archive(Archive):
     EXTENSION: ClassVar[str] = ".cb7"
+    MAGIC: ClassVar[bytes] = b"7z\xbc\xaf\x27\x1c"
     IS_READABLE: ClassVar[bool] = True
     IS_WRITEABLE: ClassVar[bool] = True
     IS_EDITABLE: ClassVar[bool] = False
 
+    def __init__(self, filepath: Path) -> None:
+        super().__init__(filepath=filepath)
+        self._handle: py7zr.SevenZipFile | None = None
+
     @classmethod
     def is_archive(cls, path: Path) -> bool:
         if not PY7ZR_AVAILABLE:
             return False
         if path.suffix.lower() != cls.EXTENSION:
             return False
-        return py7zr.is_7zfile(file=path)
+        return cls.has_magic(path=path) or py7zr.is_7zfile(file=path)
 
-    def list_filenames(self) -> list[str]:
+    @contextmanager
+    def _reader(self) -> Generator["py7zr.SevenZipFile"]:
+        if self._batching:
+            if self._handle is None:
+                self._handle = py7zr.SevenZipFile(self.filepath, "r")
+            try:
+                yield self._handle
+            finally:
+                self._handle.reset()
+            return
+        with py7zr.SevenZipFile(self.filepath, "r") as archive:
+            yield archive
+
+    def _close(self, commit: bool) -> None:  # noqa: ARG002
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            handle.close()
+
+    def _list_filenames(self) -> list[str]:
         try:
-            with py7zr.SevenZipFile(self.filepath, "r") as archive:
+            with self._reader() as archive:
                 return archive.namelist()
         except Exception as err:
             raise ComicArchiveError(f"Unable to list files in {self.filepath.name}") from err
 
     def read_file(self, filename: str) -> bytes:
         try:
-            with py7zr.SevenZipFile(self.filepath, "r") as archive:
+            with self._reader() as archive:
                 factory = py7zr.io.BytesIOFactory(maxsize)
                 archive.extract(targets=[filename], factory=factory)
-                if file_obj := factory.products.get(filename):
+                if file_obj := factory.products.pop(filename, None):
                     return file_obj.read()
                 raise ComicArchiveError(f"Unable to read {filename} in {self.filepath.name}")
         except ComicArchiveError:
@@ -61,9 +97,26 @@ class CB7Archive(Archive):
         except Exception as err:
             raise ComicArchiveError(f"Unable to read {filename} in {self.filepath.name}") from err
 
-    def extract_files(self, destination: Path) -> None:
+    def read_files(self, filenames: list[str]) -> dict[str, bytes]:
+        try:
+            with self._reader() as archive:
+                factory = py7zr.io.BytesIOFactory(maxsize)
+                archive.extract(targets=filenames, factory=factory)
+        except Exception as err:
+            raise ComicArchiveError(f"Unable to read files in {self.filepath.name}") from err
+        output = {}
+        for filename in filenames:
+            if not (file_obj := factory.products.pop(filename, None)):
+                raise ComicArchiveError(f"Unable to read {filename} in {self.filepath.name}")
+            output[filename] = file_obj.read()
+        return output
+
+    def iter_files(self, filenames: list[str]) -> Iterator[tuple[str, bytes]]:
+        yield from self.read_files(filenames=filenames).items()
+
+    def extract_files(self, destination: Path, workers: int = 1) -> None:  # noqa: ARG002
         try:
-            with py7zr.SevenZipFile(file=self.filepath, mode="r") as archive:
+            with self._reader() as archive:
                 archive.extractall(path=destination)
         except Exception as err:
             raise ComicArchiveError(
@@ -71,10 +124,14 @@ class CB7Archive(Archive):
             ) from err
 
     @classmethod
-    def archive_files(cls, src: Path, output_name: str, files: list[Path]) -> Path:
-        output_file = src.parent / (output_name + cls.EXTENSION)
+    def archive_files(
+        cls, src: Path, output_name: str, files: list[Path], output_folder: Path | None = None
+    ) -> Path:
+        output_file = (output_folder or src.parent) / (output_name + cls.EXTENSION)
         try:
-            with py7zr.SevenZipFile(output_file, "w") as archive:
+            with py7zr.SevenZipFile(
+                output_file, "w", filters=_select_filters(files=files)
+            ) as archive:
                 for file in files:
                     archive.write(file, arcname=file.name)
             return output_file
@@ -83,15 +140,24 @@ class CB7Archive(Archive):
 
     @classmethod
     def convert_from(cls, old_archive: Archive) -> Self:
-        with TemporaryDirectory(prefix=f"{old_archive.filepath.stem}_") as temp_str:
-            temp_folder = Path(temp_str)
-            old_archive.extract_files(destination=temp_folder)
+        with (
+            TemporaryDirectory(
+                prefix=f"{old_archive.filepath.stem}_", dir=old_archive.filepath.parent
+            ) as temp_str,
+            TemporaryDirectory(
+                prefix=f"{old_archive.filepath.stem}_", dir=old_archive.scratch_folder()
+            ) as scratch_str,
+        ):
+            scratch_folder = Path(scratch_str) / old_archive.filepath.stem
+            old_archive.extract_files(destination=scratch_folder)
             filepath = cls.archive_files(
-                src=temp_folder,
+                src=scratch_folder,
                 output_name=old_archive.filepath.stem,
-                files=list_files(temp_folder),
+                files=list_files(scratch_folder),
+                output_folder=Path(temp_str),
             )
             new_filepath = old_archive.filepath.with_suffix(cls.EXTENSION)
-            old_archive.filepath.unlink(missing_ok=True)
-            shutil.move(filepath, new_filepath)
+            filepath.replace(new_filepath)
+            if new_filepath != old_archive.filepath:
+                old_archive.filepath.unlink(missing_ok=True)
             return cls(filepath=new_filepath)
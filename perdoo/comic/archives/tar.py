@@ -1,16 +1,24 @@
-__all__ = ["CBTArchive"]
+__all__ = ["ISAL_AVAILABLE", "CBTArchive"]
 
 import logging
-import shutil
 import tarfile
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import ClassVar
+from typing import IO, ClassVar
 
-from perdoo.comic.archives._base import Archive
+from perdoo.comic.archives._base import COPY_BUFSIZE, Archive
 from perdoo.comic.errors import ComicArchiveError
 from perdoo.utils import list_files
 
+try:
+    from isal import igzip  # ty:ignore[unresolved-import]
+
+    ISAL_AVAILABLE = True
+except ImportError:
+    ISAL_AVAILABLE = False
+
 try:
     from typing import Self  # Python >= 3.11  # ty:ignore[unresolved-import]
 except ImportError:
@@ -19,54 +27,151 @@ except ImportError:
 LOGGER = logging.getLogger(__name__)
 
 
+def _is_gzip(path: Path) -> bool:
+    with path.open("rb") as stream:
+        return stream.read(2) == b"\x1f\x8b"
+
+
 class CBTArchive(Archive):
     EXTENSION: ClassVar[str] = ".cbt"
-    IS_READABLE: ClassVar[bool] = False
+    MAGIC: ClassVar[bytes] = b"ustar"
+    MAGIC_OFFSET: ClassVar[int] = 257
+    IS_READABLE: ClassVar[bool] = True
     IS_WRITEABLE: ClassVar[bool] = True
     IS_EDITABLE: ClassVar[bool] = False
+    IS_STREAMABLE: ClassVar[bool] = True
 
     @classmethod
     def is_archive(cls, path: Path) -> bool:
         if path.suffix.lower() != cls.EXTENSION:
             return False
-        return tarfile.is_tarfile(name=path)
+        return cls.has_magic(path=path) or tarfile.is_tarfile(name=path)
 
-    def list_filenames(self) -> list[str]:
+    @contextmanager
+    def _reader(self) -> Generator[tarfile.TarFile]:
+        if ISAL_AVAILABLE and _is_gzip(path=self.filepath):
+            with (
+                igzip.IGzipFile(self.filepath, "rb") as stream,
+                tarfile.open(fileobj=stream, mode="r|") as archive,
+            ):
+                yield archive
+            return
+        with (
+            self.filepath.open("rb", buffering=COPY_BUFSIZE) as stream,
+            tarfile.open(fileobj=stream, mode="r|*") as archive,
+        ):
+            yield archive
+
+    def _list_filenames(self) -> list[str]:
         try:
-            with tarfile.open(name=self.filepath, mode="r") as archive:
-                return archive.getnames()
+            with self._reader() as archive:
+                return [x.name for x in archive]
         except Exception as err:
             raise ComicArchiveError(f"Unable to list files in {self.filepath.name}") from err
 
-    def extract_files(self, destination: Path) -> None:
+    def read_file(self, filename: str) -> bytes:
+        try:
+            return self.read_files(filenames=[filename])[filename]
+        except ComicArchiveError as err:
+            raise ComicArchiveError(f"Unable to read {filename} in {self.filepath.name}") from err
+
+    def iter_files(self, filenames: list[str]) -> Iterator[tuple[str, bytes]]:
+        remaining = set(filenames)
         try:
-            with tarfile.open(name=self.filepath, mode="r") as archive:
+            with self._reader() as archive:
+                for member in archive:
+                    if member.name not in remaining:
+                        continue
+                    if stream := archive.extractfile(member):
+                        remaining.discard(member.name)
+                        yield member.name, stream.read()
+                    if not remaining:
+                        break
+        except Exception as err:
+            raise ComicArchiveError(f"Unable to read files in {self.filepath.name}") from err
+        if remaining:
+            raise ComicArchiveError(
+                f"Unable to read {', '.join(sorted(remaining))} in {self.filepath.name}"
+            )
+
+    def iter_members(self) -> Iterator[tuple[str, int, float, IO[bytes]]]:
+        try:
+            with self._reader() as archive:
+                for member in archive:
+                    name = Path(member.name).name
+                    if not member.isfile() or not name or name.startswith("."):
+                        continue
+                    if stream := archive.extractfile(member):
+                        yield name, member.size, member.mtime, stream
+        except Exception as err:
+            raise ComicArchiveError(f"Unable to stream files from {self.filepath.name}.") from err
+
+    def extract_files(self, destination: Path, workers: int = 1) -> None:  # noqa: ARG002
+        try:
+            with self._reader() as archive:
                 archive.extractall(path=destination, filter="data")
         except Exception as err:
             raise ComicArchiveError(f"Unable to extract files from {self.filepath.name}.") from err
 
     @classmethod
-    def archive_files(cls, src: Path, output_name: str, files: list[Path]) -> Path:
-        output_file = src.parent / (output_name + cls.EXTENSION)
+    def archive_files(
+        cls, src: Path, output_name: str, files: list[Path], output_folder: Path | None = None
+    ) -> Path:
+        output_file = (output_folder or src.parent) / (output_name + cls.EXTENSION)
         try:
-            with tarfile.open(name=output_file, mode="w:gz") as archive:
+            with tarfile.TarFile(name=output_file, mode="w", copybufsize=COPY_BUFSIZE) as archive:
                 for file in files:
-                    archive.add(file, arcname=file.name)
+                    stat = file.stat()
+                    info = tarfile.TarInfo(name=file.name)
+                    info.size = stat.st_size
+                    info.mtime = int(stat.st_mtime)
+                    with file.open("rb", buffering=COPY_BUFSIZE) as stream:
+                        archive.addfile(info, fileobj=stream)
+            return output_file
+        except Exception as err:
+            raise ComicArchiveError(f"Unable to archive files to {output_file.name}") from err
+
+    @classmethod
+    def archive_members(
+        cls, folder: Path, output_name: str, members: Iterator[tuple[str, int, float, IO[bytes]]]
+    ) -> Path:
+        output_file = folder / (output_name + cls.EXTENSION)
+        try:
+            with tarfile.TarFile(name=output_file, mode="w", copybufsize=COPY_BUFSIZE) as archive:
+                for name, size, mtime, stream in members:
+                    info = tarfile.TarInfo(name=name)
+                    info.size = size
+                    info.mtime = int(mtime)
+                    archive.addfile(info, fileobj=stream)
             return output_file
         except Exception as err:
             raise ComicArchiveError(f"Unable to archive files to {output_file.name}") from err
 
     @classmethod
     def convert_from(cls, old_archive: Archive) -> Self:
-        with TemporaryDirectory(prefix=f"{old_archive.filepath.stem}_") as temp_str:
-            temp_folder = Path(temp_str)
-            old_archive.extract_files(destination=temp_folder)
-            filepath = cls.archive_files(
-                src=temp_folder,
-                output_name=old_archive.filepath.stem,
-                files=list_files(temp_folder),
-            )
+        with TemporaryDirectory(
+            prefix=f"{old_archive.filepath.stem}_", dir=old_archive.filepath.parent
+        ) as temp_str:
+            if old_archive.IS_STREAMABLE:
+                filepath = cls.archive_members(
+                    folder=Path(temp_str),
+                    output_name=old_archive.filepath.stem,
+                    members=old_archive.iter_members(),
+                )
+            else:
+                with TemporaryDirectory(
+                    prefix=f"{old_archive.filepath.stem}_", dir=old_archive.scratch_folder()
+                ) as scratch_str:
+                    scratch_folder = Path(scratch_str) / old_archive.filepath.stem
+                    old_archive.extract_files(destination=scratch_folder)
+                    filepath = cls.archive_files(
+                        src=scratch_folder,
+                        output_name=old_archive.filepath.stem,
+                        files=list_files(scratch_folder),
+                        output_folder=Path(temp_str),
+                    )
             new_filepath = old_archive.filepath.with_suffix(cls.EXTENSION)
-            old_archive.filepath.unlink(missing_ok=True)
-            shutil.move(filepath, new_filepath)
+            filepath.replace(new_filepath)
+            if new_filepath != old_archive.filepath:
+                old_archive.filepath.unlink(missing_ok=True)
             return cls(filepath=new_filepath)
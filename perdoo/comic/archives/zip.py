@@ -1,14 +1,19 @@
 __all__ = ["CBZArchive"]
 
 import logging
+import posixpath
 import shutil
+import time
+from collections.abc import Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import ClassVar
+from typing import IO, ClassVar
 
-from zipremove import ZIP_DEFLATED, ZipFile, is_zipfile
+from zipremove import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo, is_zipfile
 
-from perdoo.comic.archives._base import Archive
+from perdoo.comic.archives._base import COMPRESSED_EXTENSIONS, COPY_BUFSIZE, Archive
 from perdoo.comic.errors import ComicArchiveError
 from perdoo.utils import list_files
 
@@ -20,61 +25,115 @@ except ImportError:
 LOGGER = logging.getLogger(__name__)
 
 
+def _compress_type(filename: str) -> int:
+    if Path(filename).suffix.lower() in COMPRESSED_EXTENSIONS:
+        return ZIP_STORED
+    return ZIP_DEFLATED
+
+
+def _date_time(mtime: float) -> tuple[int, int, int, int, int, int]:
+    return max(time.localtime(mtime)[:6], (1980, 1, 1, 0, 0, 0))
+
+
 class CBZArchive(Archive):
     EXTENSION: ClassVar[str] = ".cbz"
+    MAGIC: ClassVar[bytes] = b"PK\x03\x04"
     IS_READABLE: ClassVar[bool] = True
     IS_WRITEABLE: ClassVar[bool] = True
     IS_EDITABLE: ClassVar[bool] = True
+    IS_STREAMABLE: ClassVar[bool] = True
+
+    def __init__(self, filepath: Path) -> None:
+        super().__init__(filepath=filepath)
+        self._handle: ZipFile | None = None
+        self._removed: list[ZipInfo] = []
 
     @classmethod
     def is_archive(cls, path: Path) -> bool:
         if path.suffix.lower() != cls.EXTENSION:
             return False
-        return is_zipfile(filename=path)
+        return cls.has_magic(path=path) or is_zipfile(filename=path)
+
+    @contextmanager
+    def _reader(self) -> Generator[ZipFile]:
+        if self._batching:
+            if self._handle is None:
+                self._handle = ZipFile(file=self.filepath, mode="r")
+            yield self._handle
+            return
+        with ZipFile(file=self.filepath, mode="r") as archive:
+            yield archive
+
+    @contextmanager
+    def _editor(self) -> Generator[tuple[ZipFile, list[ZipInfo]]]:
+        self._reset_filenames()
+        if self._batching:
+            if self._handle is None or self._handle.mode == "r":
+                if self._handle is not None:
+                    self._handle.close()
+                self._handle = ZipFile(file=self.filepath, mode="a")
+            yield self._handle, self._removed
+            return
+        removed = []
+        with ZipFile(file=self.filepath, mode="a") as archive:
+            yield archive, removed
+            if removed:
+                archive.repack(removed)
+
+    def _close(self, commit: bool) -> None:
+        handle, self._handle = self._handle, None
+        removed, self._removed = self._removed, []
+        if handle is None:
+            return
+        if not commit:
+            handle.close()
+            return
+        try:
+            with handle:
+                if removed:
+                    handle.repack(removed)
+        except Exception as err:
+            raise ComicArchiveError(f"Unable to update {self.filepath.name}.") from err
 
-    def list_filenames(self) -> list[str]:
+    def _list_filenames(self) -> list[str]:
         try:
-            with ZipFile(file=self.filepath, mode="r") as archive:
+            with self._reader() as archive:
                 return archive.namelist()
         except Exception as err:
             raise ComicArchiveError(f"Unable to list files from {self.filepath.name}.") from err
 
     def read_file(self, filename: str) -> bytes:
         try:
-            with (
-                ZipFile(file=self.filepath, mode="r") as archive,
-                archive.open(filename) as zip_file,
-            ):
+            with self._reader() as archive, archive.open(filename) as zip_file:
                 return zip_file.read()
         except Exception as err:
             raise ComicArchiveError(f"Unable to read {filename}.") from err
 
     def write_file(self, filename: str, data: bytes) -> None:
         try:
-            with ZipFile(file=self.filepath, mode="a") as archive:
+            with self._editor() as (archive, removed):
                 if filename in archive.namelist():
-                    removed = archive.remove(filename)
-                    archive.repack([removed])
-                archive.writestr(filename, data)
+                    removed.append(archive.remove(filename))
+                archive.writestr(
+                    filename, data, compress_type=_compress_type(filename), compresslevel=1
+                )
         except Exception as err:
             raise ComicArchiveError(f"Unable to write {filename}.") from err
 
     def delete_file(self, filename: str) -> None:
-        if filename not in self.list_filenames():
+        if not self.exists(filename=filename):
             return
         try:
-            with ZipFile(file=self.filepath, mode="a") as archive:
-                removed = archive.remove(filename)
-                archive.repack([removed])
+            with self._editor() as (archive, removed):
+                removed.append(archive.remove(filename))
         except Exception as err:
             raise ComicArchiveError(f"Unable to delete {filename}.") from err
 
     def rename_file(self, filename: str, new_name: str, override: bool = False) -> None:
-        if filename not in self.list_filenames():
+        if not self.exists(filename=filename):
             raise ComicArchiveError(f"Unable to rename {filename} as it does not exist.")
         try:
-            removed = []
-            with ZipFile(file=self.filepath, mode="a") as archive:
+            with self._editor() as (archive, removed):
                 if new_name in archive.namelist():
                     if not override:
                         raise ComicArchiveError(
@@ -82,43 +141,124 @@ class CBZArchive(Archive):
                         )
                     removed.append(archive.remove(new_name))
                 removed.append(archive.remove(archive.copy(filename, new_name)))
-                archive.repack(removed)
         except ComicArchiveError:
             raise
         except Exception as err:
             raise ComicArchiveError(f"Unable to rename {filename} to {new_name}.") from err
 
-    def extract_files(self, destination: Path) -> None:
+    def iter_members(self) -> Iterator[tuple[str, int, float, IO[bytes]]]:
         try:
-            with ZipFile(file=self.filepath, mode="r") as archive:
-                archive.extractall(path=destination)
+            with self._reader() as archive:
+                for info in archive.infolist():
+                    name = Path(info.filename).name
+                    if info.is_dir() or not name or name.startswith("."):
+                        continue
+                    mtime = time.mktime((*info.date_time, 0, 0, -1))
+                    with archive.open(info) as stream:
+                        yield name, info.file_size, mtime, stream
+        except Exception as err:
+            raise ComicArchiveError(f"Unable to stream files from {self.filepath.name}.") from err
+
+    def _extract_members(self, destination: Path, filenames: list[str]) -> None:
+        with ZipFile(file=self.filepath, mode="r") as archive:
+            for filename in filenames:
+                archive.extract(filename, path=destination)
+
+    def extract_files(self, destination: Path, workers: int = 1) -> None:
+        try:
+            with self._reader() as archive:
+                filenames = archive.namelist()
+                if workers < 2 or (self._handle is not None and self._handle.mode != "r"):
+                    archive.extractall(path=destination)
+                    return
+                folders: dict[str, str] = {}
+                for filename in filenames:
+                    folders.setdefault(posixpath.dirname(filename), filename)
+                for filename in folders.values():
+                    archive.extract(filename, path=destination)
+            extracted = set(folders.values())
+            filenames = [x for x in filenames if x not in extracted]
+            workers = min(workers, len(filenames))
+            if not workers:
+                return
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(
+                    executor.map(
+                        self._extract_members,
+                        [destination] * workers,
+                        [filenames[x::workers] for x in range(workers)],
+                    )
+                )
         except Exception as err:
             raise ComicArchiveError(
                 f"Unable to extract all files from {self.filepath.name} to {destination}."
             ) from err
 
     @classmethod
-    def archive_files(cls, src: Path, output_name: str, files: list[Path]) -> Path:
-        output_file = src.parent / (output_name + cls.EXTENSION)
+    def archive_files(
+        cls, src: Path, output_name: str, files: list[Path], output_folder: Path | None = None
+    ) -> Path:
+        output_file = (output_folder or src.parent) / (output_name + cls.EXTENSION)
         try:
-            with ZipFile(file=output_file, mode="w", compression=ZIP_DEFLATED) as archive:
+            with ZipFile(
+                file=output_file, mode="w", compression=ZIP_DEFLATED, compresslevel=1
+            ) as archive:
                 for file in files:
-                    archive.write(file, arcname=file.name)
+                    archive.write(file, arcname=file.name, compress_type=_compress_type(file.name))
+            return output_file
+        except Exception as err:
+            raise ComicArchiveError(f"Unable to archive files to {output_file.name}.") from err
+
+    @classmethod
+    def archive_members(
+        cls, folder: Path, output_name: str, members: Iterator[tuple[str, int, float, IO[bytes]]]
+    ) -> Path:
+        output_file = folder / (output_name + cls.EXTENSION)
+        try:
+            with ZipFile(
+                file=output_file, mode="w", compression=ZIP_DEFLATED, compresslevel=1
+            ) as archive:
+                for name, _, mtime, stream in members:
+                    info = ZipInfo(filename=name, date_time=_date_time(mtime))
+                    if _compress_type(name) == ZIP_DEFLATED:
+                        archive.writestr(
+                            info, stream.read(), compress_type=ZIP_DEFLATED, compresslevel=1
+                        )
+                        continue
+                    info.compress_type = ZIP_STORED
+                    with archive.open(info, mode="w", force_zip64=True) as output:
+                        shutil.copyfileobj(stream, output, COPY_BUFSIZE)
             return output_file
+        except ComicArchiveError:
+            raise
         except Exception as err:
             raise ComicArchiveError(f"Unable to archive files to {output_file.name}.") from err
 
     @classmethod
     def convert_from(cls, old_archive: Archive) -> Self:
-        with TemporaryDirectory(prefix=f"{old_archive.filepath.stem}_") as temp_str:
-            temp_folder = Path(temp_str)
-            old_archive.extract_files(destination=temp_folder)
-            filepath = cls.archive_files(
-                src=temp_folder,
-                output_name=old_archive.filepath.stem,
-                files=list_files(temp_folder),
-            )
+        with TemporaryDirectory(
+            prefix=f"{old_archive.filepath.stem}_", dir=old_archive.filepath.parent
+        ) as temp_str:
+            if old_archive.IS_STREAMABLE:
+                filepath = cls.archive_members(
+                    folder=Path(temp_str),
+                    output_name=old_archive.filepath.stem,
+                    members=old_archive.iter_members(),
+                )
+            else:
+                with TemporaryDirectory(
+                    prefix=f"{old_archive.filepath.stem}_", dir=old_archive.scratch_folder()
+                ) as scratch_str:
+                    scratch_folder = Path(scratch_str) / old_archive.filepath.stem
+                    old_archive.extract_files(destination=scratch_folder)
+                    filepath = cls.archive_files(
+                        src=scratch_folder,
+                        output_name=old_archive.filepath.stem,
+                        files=list_files(scratch_folder),
+                        output_folder=Path(temp_str),
+                    )
             new_filepath = old_archive.filepath.with_suffix(cls.EXTENSION)
-            old_archive.filepath.unlink(missing_ok=True)
-            shutil.move(filepath, new_filepath)
+            filepath.replace(new_filepath)
+            if new_filepath != old_archive.filepath:
+                old_archive.filepath.unlink(missing_ok=True)
             return cls(filepath=new_filepath)
@@ -2,6 +2,8 @@ __all__ = ["Comic"]
 
 import logging
 import shutil
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Final, Literal
 
@@ -13,6 +15,11 @@ from perdoo.comic.metadata import ComicInfo, MetronInfo
 LOGGER = logging.getLogger(__name__)
 
 METADATA_FILENAMES: Final[frozenset[str]] = frozenset([MetronInfo.FILENAME, ComicInfo.FILENAME])
+ARCHIVE_TYPES: Final[dict[str, type[Archive]]] = {
+    "cbz": CBZArchive,
+    "cbt": CBTArchive,
+    "cb7": CB7Archive,
+}
 
 
 class Comic:
@@ -27,21 +34,36 @@ class Comic:
     def filepath(self) -> Path:
         return self.archive.filepath
 
-    def open_session(self) -> ArchiveSession:
-        return ArchiveSession(self.archive)
+    @contextmanager
+    def open_session(
+        self, extension: Literal["cbz", "cbt", "cb7"] | None = None, workers: int = 1
+    ) -> Generator[ArchiveSession]:
+        output = None
+        if extension:
+            output = ARCHIVE_TYPES[extension]
+            if output.IS_EDITABLE:
+                self.convert_to(extension=extension)
+                output = None
+        session = ArchiveSession(archive=self.archive, output=output, workers=workers)
+        with session:
+            yield session
+        self._archive = session.archive
 
     def convert_to(self, extension: Literal["cbz", "cbt", "cb7"]) -> None:
-        cls = {"cbz": CBZArchive, "cbt": CBTArchive, "cb7": CB7Archive}[extension]
+        cls = ARCHIVE_TYPES[extension]
         if not isinstance(self.archive, cls):
             self._archive = cls.convert_from(old_archive=self.archive)
 
     def read_metadata(self, session: ArchiveSession) -> tuple[MetronInfo | None, ComicInfo | None]:
+        contents = self.read_files(
+            session=session, filenames=[MetronInfo.FILENAME, ComicInfo.FILENAME]
+        )
         metron_info = None
-        if session.contains(filename=MetronInfo.FILENAME):
-            metron_info = MetronInfo.from_bytes(content=session.read(filename=MetronInfo.FILENAME))
+        if MetronInfo.FILENAME in contents:
+            metron_info = MetronInfo.from_bytes(content=contents[MetronInfo.FILENAME])
         comic_info = None
-        if session.contains(filename=ComicInfo.FILENAME):
-            comic_info = ComicInfo.from_bytes(content=session.read(filename=ComicInfo.FILENAME))
+        if ComicInfo.FILENAME in contents:
+            comic_info = ComicInfo.from_bytes(content=contents[ComicInfo.FILENAME])
         return metron_info, comic_info
 
     def read_file(self, session: ArchiveSession, filename: str) -> bytes | None:
@@ -49,12 +71,21 @@ class Comic:
             return session.read(filename=filename)
         return None
 
+    def read_files(self, session: ArchiveSession, filenames: list[str]) -> dict[str, bytes]:
+        return dict(self.iter_files(session=session, filenames=filenames))
+
+    def iter_files(
+        self, session: ArchiveSession, filenames: list[str]
+    ) -> Iterator[tuple[str, bytes]]:
+        existing = set(session.list())
+        yield from session.iter_files(filenames=[x for x in filenames if x in existing])
+
     def list_images(self, image_extensions: tuple[str, ...]) -> list[Path]:
         return humansorted(
             [
-                Path(name)
-                for name in self.archive.list_filenames()
-                if Path(name).suffix.lower() in image_extensions
+                Path(x)
+                for x in self.archive.list_filenames()
+                if x.lower().endswith(image_extensions)
             ],
             alg=ns.NA | ns.G | ns.P,
         )
@@ -62,10 +93,9 @@ class Comic:
     def list_extras(self, image_extensions: tuple[str, ...]) -> list[Path]:
         return humansorted(
             [
-                Path(name)
-                for name in self.archive.list_filenames()
-                if name not in METADATA_FILENAMES
-                and Path(name).suffix.lower() not in image_extensions
+                Path(x)
+                for x in self.archive.list_filenames()
+                if x not in METADATA_FILENAMES and not x.lower().endswith(image_extensions)
             ],
             alg=ns.NA | ns.G | ns.P,
         )
@@ -2,11 +2,14 @@ __all__ = ["Metadata", "PascalModel", "sanitize"]
 
 import logging
 import re
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 from typing import ClassVar, Literal
 
+from lxml import etree  # ty:ignore[unresolved-import]
 from pydantic.alias_generators import to_pascal
 from pydantic_xml import BaseXmlModel
 from pydantic_xml.element import SearchMode
@@ -21,6 +24,8 @@ except ImportError:
     from typing_extensions import Self  # Python < 3.11
 
 LOGGER = logging.getLogger(__name__)
+XML_PARSER = threading.local()
+PATTERN_REGEX = re.compile(r"{(?P<key>[a-zA-Z-]+)(?::(?P<padding>\d+))?}")
 
 
 def sanitize(value: str | int | None, seperator: Literal["-", "_", ".", " "]) -> str | None:
@@ -32,6 +37,26 @@ def sanitize(value: str | int | None, seperator: Literal["-", "_", ".", " "]) ->
     return value.replace(" ", seperator)
 
 
+def _xml_parser() -> etree.XMLParser:
+    parser = getattr(XML_PARSER, "parser", None)
+    if parser is None:
+        parser = XML_PARSER.parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+    return parser
+
+
+@cache
+def _compile_pattern(pattern: str) -> tuple[tuple[str, str | None, str | None], ...]:
+    segments = []
+    position = 0
+    for match in PATTERN_REGEX.finditer(pattern):
+        segments.append(
+            (pattern[position : match.start()], match.group("key"), match.group("padding"))
+        )
+        position = match.end()
+    segments.append((pattern[position:], None, None))
+    return tuple(segments)
+
+
 class PascalModel(
     BaseXmlModel,
     alias_generator=to_pascal,
@@ -55,7 +80,7 @@ class Metadata(PascalModel, ABC):
 
     @classmethod
     def from_bytes(cls, content: bytes) -> Self:
-        return cls.from_xml(content)
+        return cls.from_xml(content, parser=_xml_parser())
 
     def to_bytes(self) -> bytes:
         content = self.to_xml(skip_empty=True, pretty_print=True, encoding="UTF-8")
@@ -80,18 +105,19 @@ class Metadata(PascalModel, ABC):
         pattern: str,
         seperator: Literal["-", "_", ".", " "],
     ) -> str:
-        def replace_match(match: re.Match) -> str:
-            key = match.group("key")
-            padding = match.group("padding")
-
+        output = []
+        for literal, key, padding in _compile_pattern(pattern=pattern):
+            output.append(literal)
+            if key is None:
+                continue
             if key not in pattern_map:
                 LOGGER.warning("Unknown pattern: %s", key)
-                return key
+                output.append(key)
+                continue
             value = pattern_map[key](self)
 
             if padding and (isinstance(value, int) or (isinstance(value, str) and value.isdigit())):
-                return f"{int(value):0{padding}}"
-            return sanitize(value=value, seperator=seperator) or ""
-
-        pattern_regex = re.compile(r"{(?P<key>[a-zA-Z-]+)(?::(?P<padding>\d+))?}")
-        return pattern_regex.sub(replace_match, pattern)
+                output.append(f"{int(value):0{padding}}")
+            else:
+                output.append(sanitize(value=value, seperator=seperator) or "")
+        return "".join(output)
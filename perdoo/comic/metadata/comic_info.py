@@ -35,9 +35,9 @@ class YesNo(Enum):
 
     @staticmethod
     def load(value: str) -> "YesNo":
-        for entry in YesNo:
-            if entry.value.replace(" ", "").casefold() == value.replace(" ", "").casefold():
-                return entry
+        entry = YES_NO_VALUES.get(value.replace(" ", "").casefold())
+        if entry is not None:
+            return entry
         LOGGER.warning("'%s' isn't a valid YesNo", value)
         return YesNo.UNKNOWN
 
@@ -45,6 +45,9 @@ class YesNo(Enum):
         return self.value
 
 
+YES_NO_VALUES: dict[str, YesNo] = {x.value.replace(" ", "").casefold(): x for x in YesNo}
+
+
 class Manga(Enum):
     UNKNOWN = "Unknown"
     NO = "No"
@@ -53,9 +56,9 @@ class Manga(Enum):
 
     @staticmethod
     def load(value: str) -> "Manga":
-        for entry in Manga:
-            if entry.value.replace(" ", "").casefold() == value.replace(" ", "").casefold():
-                return entry
+        entry = MANGA_VALUES.get(value.replace(" ", "").casefold())
+        if entry is not None:
+            return entry
         LOGGER.warning("'%s' isn't a valid Manga", value)
         return Manga.UNKNOWN
 
@@ -63,6 +66,9 @@ class Manga(Enum):
         return self.value
 
 
+MANGA_VALUES: dict[str, Manga] = {x.value.replace(" ", "").casefold(): x for x in Manga}
+
+
 class AgeRating(Enum):
     UNKNOWN = "Unknown"
     ADULTS_ONLY = "Adults Only 18+"
@@ -82,9 +88,9 @@ class AgeRating(Enum):
 
     @staticmethod
     def load(value: str) -> "AgeRating":
-        for entry in AgeRating:
-            if entry.value.replace(" ", "").casefold() == value.replace(" ", "").casefold():
-                return entry
+        entry = AGE_RATING_VALUES.get(value.replace(" ", "").casefold())
+        if entry is not None:
+            return entry
         LOGGER.warning("'%s' isn't a valid AgeRating", value)
         return AgeRating.UNKNOWN
 
@@ -92,6 +98,11 @@ class AgeRating(Enum):
         return self.value
 
 
+AGE_RATING_VALUES: dict[str, AgeRating] = {
+    x.value.replace(" ", "").casefold(): x for x in AgeRating
+}
+
+
 class PageType(Enum):
     FRONT_COVER = "FrontCover"
     INNER_COVER = "InnerCover"
@@ -107,9 +118,9 @@ class PageType(Enum):
 
     @staticmethod
     def load(value: str) -> "PageType":
-        for entry in PageType:
-            if entry.value.replace(" ", "").casefold() == value.replace(" ", "").casefold():
-                return entry
+        entry = PAGE_TYPE_VALUES.get(value.replace(" ", "").casefold())
+        if entry is not None:
+            return entry
         LOGGER.warning("'%s' isn't a valid PageType", value)
         return PageType.OTHER
 
@@ -117,6 +128,9 @@ class PageType(Enum):
         return self.value
 
 
+PAGE_TYPE_VALUES: dict[str, PageType] = {x.value.replace(" ", "").casefold(): x for x in PageType}
+
+
 class Page(PascalModel):
     bookmark: str | None = attr(default=None)
     double_page: bool = attr(default=False)
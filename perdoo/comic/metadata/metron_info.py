@@ -45,9 +45,9 @@ class AgeRating(Enum):
 
     @staticmethod
     def load(value: str) -> "AgeRating":
-        for entry in AgeRating:
-            if entry.value.replace(" ", "").casefold() == value.replace(" ", "").casefold():
-                return entry
+        entry = AGE_RATING_VALUES.get(value.replace(" ", "").casefold())
+        if entry is not None:
+            return entry
         LOGGER.warning("'%s' isn't a valid AgeRating", value)
         return AgeRating.UNKNOWN
 
@@ -55,6 +55,11 @@ class AgeRating(Enum):
         return self.value
 
 
+AGE_RATING_VALUES: dict[str, AgeRating] = {
+    x.value.replace(" ", "").casefold(): x for x in AgeRating
+}
+
+
 class Arc(PascalModel):
     id: str | None = attr(name="id", default=None)
     name: str = element()
@@ -138,9 +143,9 @@ class Role(Enum):
 
     @staticmethod
     def load(value: str) -> "Role":
-        for entry in Role:
-            if entry.value.replace(" ", "").casefold() == value.replace(" ", "").casefold():
-                return entry
+        entry = ROLE_VALUES.get(value.replace(" ", "").casefold())
+        if entry is not None:
+            return entry
         LOGGER.warning("'%s' isn't a valid Role", value)
         return Role.OTHER
 
@@ -148,6 +153,9 @@ class Role(Enum):
         return self.value
 
 
+ROLE_VALUES: dict[str, Role] = {x.value.replace(" ", "").casefold(): x for x in Role}
+
+
 class Credit(PascalModel):
     creator: Resource[str] = element()
     roles: list[Resource[Role]] = wrapped(
@@ -187,15 +195,20 @@ class InformationSource(Enum):
 
     @staticmethod
     def load(value: str) -> "InformationSource":
-        for entry in InformationSource:
-            if entry.value.replace(" ", "").casefold() == value.replace(" ", "").casefold():
-                return entry
+        entry = INFORMATION_SOURCE_VALUES.get(value.replace(" ", "").casefold())
+        if entry is not None:
+            return entry
         raise ValueError(f"'{value}' isn't a valid InformationSource")
 
     def __str__(self) -> str:
         return self.value
 
 
+INFORMATION_SOURCE_VALUES: dict[str, InformationSource] = {
+    x.value.replace(" ", "").casefold(): x for x in InformationSource
+}
+
+
 class Id(PascalModel):
     primary: bool = attr(name="primary", default=False)
     source: InformationSource = attr(name="source")
@@ -256,15 +269,18 @@ class Format(Enum):
 
     @staticmethod
     def load(value: str) -> "Format":
-        for entry in Format:
-            if entry.value.replace(" ", "").casefold() == value.replace(" ", "").casefold():
-                return entry
+        entry = FORMAT_VALUES.get(value.replace(" ", "").casefold())
+        if entry is not None:
+            return entry
         raise ValueError(f"'{value}' isn't a valid Format")
 
     def __str__(self) -> str:
         return self.value
 
 
+FORMAT_VALUES: dict[str, Format] = {x.value.replace(" ", "").casefold(): x for x in Format}
+
+
 class Series(PascalModel):
     alternative_names: list[AlternativeName] = wrapped(
         path="AlternativeNames", entity=element(tag="AlternativeName", default_factory=list)
@@ -1,11 +1,12 @@
 __all__ = ["SETTINGS"]
 
 from enum import Enum
+from hashlib import blake2b
 from pathlib import Path
 from typing import Annotated, Any, ClassVar, Literal
 
 import tomli_w as tomlwriter
-from pydantic import BeforeValidator
+from pydantic import BeforeValidator, PrivateAttr
 from rich.panel import Panel
 
 from perdoo import get_config_root, get_data_root
@@ -113,6 +114,7 @@ def _stringify_values(content: dict[str, Any]) -> dict[str, Any]:
 
 class Settings(SettingsModel):
     _file: ClassVar[Path] = get_config_root() / "settings.toml"
+    _digest: bytes | None = PrivateAttr(default=None)
 
     output: Output = Output()
     services: Services = Services()
@@ -125,15 +127,19 @@ class Settings(SettingsModel):
     def load(cls) -> Self:
         if not cls._file.exists():
             cls().save()
-        with cls._file.open("rb") as stream:
-            content = tomlreader.load(stream)
-        return cls(**content)
+        data = cls._file.read_bytes()
+        settings = cls(**tomlreader.loads(data.decode("utf-8")))
+        settings._digest = blake2b(data).digest()
+        return settings
 
     def save(self) -> Self:
-        with self.path.open("wb") as stream:
-            content = self.model_dump(by_alias=False)
-            content = _stringify_values(content=content)
-            tomlwriter.dump(content, stream)
+        content = self.model_dump(by_alias=False)
+        content = _stringify_values(content=content)
+        data = tomlwriter.dumps(content).encode("utf-8")
+        digest = blake2b(data).digest()
+        if digest != self._digest:
+            self.path.write_bytes(data)
+            self._digest = digest
         return self
 
     @classmethod
@@ -6,11 +6,14 @@ __all__ = [
     "blank_is_none",
     "delete_empty_folders",
     "flatten_dict",
+    "iter_files",
     "list_files",
     "recursive_delete",
 ]
 
 import logging
+import os
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -63,17 +66,20 @@ class Search:
     filename: str
 
 
+def iter_files(path: Path, *extensions: str) -> Iterator[Path]:
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                if not entry.name.startswith(".") and (
+                    not extensions or entry.name.lower().endswith(extensions)
+                ):
+                    yield Path(entry.path)
+            elif entry.is_dir():
+                yield from iter_files(Path(entry.path), *extensions)
+
+
 def list_files(path: Path, *extensions: str) -> list[Path]:
-    files = []
-    for file in path.iterdir():
-        if file.is_file():
-            if not file.name.startswith(".") and (
-                not extensions or file.suffix.lower() in extensions
-            ):
-                files.append(file)
-        elif file.is_dir():
-            files.extend(list_files(file, *extensions))
-    return humansorted(files, alg=ns.NA | ns.G | ns.P)
+    return humansorted(iter_files(path, *extensions), alg=ns.NA | ns.G | ns.P)
 
 
 def flatten_dict(content: dict[str, Any], parent_key: str = "") -> dict[str, Any]:
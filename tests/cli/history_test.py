@@ -0,0 +1,104 @@
+from datetime import date, datetime
+from pathlib import Path
+from threading import Lock
+from unittest.mock import patch
+
+import pytest
+from zipremove import ZipFile
+
+from perdoo.cli._history import ProcessHistory, file_digest
+from perdoo.cli._sync import SyncOption
+from perdoo.cli.process import history_profile, process_comic
+from perdoo.comic import Comic
+from perdoo.comic.metadata import MetronInfo
+from perdoo.comic.metadata.metron_info import Series
+
+
+@pytest.fixture
+def comic(tmp_path: Path) -> Comic:
+    filepath = tmp_path / "Example 001.cbz"
+    with ZipFile(filepath, "w") as archive:
+        archive.writestr("001.jpg", "Page 1")
+    return Comic(filepath=filepath)
+
+
+def run_process_comic(comic: Comic, history: ProcessHistory, today: int) -> None:
+    process_comic(
+        entry=comic,
+        history=history,
+        services={},
+        service_order=(),
+        sync=SyncOption.OUTDATED,
+        today=today,
+        skip_convert=True,
+        skip_clean=True,
+        skip_rename=True,
+        extract_workers=1,
+        lock=Lock(),
+    )
+
+
+def test_file_digest(tmp_path: Path) -> None:
+    first = tmp_path / "first.cbz"
+    first.write_bytes(b"content")
+    second = tmp_path / "second.cbz"
+    second.write_bytes(b"content")
+
+    assert file_digest(filepath=first) == file_digest(filepath=second)
+    second.write_bytes(b"changed")
+    assert file_digest(filepath=first) != file_digest(filepath=second)
+
+
+def test_process_history(tmp_path: Path) -> None:
+    path = tmp_path / "history.sqlite"
+    with ProcessHistory(path=path, profile="default") as history:
+        assert not history.is_processed(digest="abc", today=100)
+        history.add(digest="abc", day=100)
+        assert history.is_processed(digest="abc", today=127)
+        assert not history.is_processed(digest="abc", today=128)
+
+    with ProcessHistory(path=path, profile="default") as history:
+        assert history.is_processed(digest="abc", today=100)
+    with ProcessHistory(path=path, profile="changed") as history:
+        assert not history.is_processed(digest="abc", today=100)
+
+
+def test_history_profile_tracks_sync(tmp_path: Path) -> None:
+    path = tmp_path / "history.sqlite"
+    flags = {"skip_convert": False, "skip_clean": False, "skip_rename": False}
+    skipped = history_profile(sync=SyncOption.SKIP, **flags)
+    with ProcessHistory(path=path, profile=skipped) as history:
+        history.add(digest="abc", day=100)
+
+    outdated = history_profile(sync=SyncOption.OUTDATED, **flags)
+    assert outdated != skipped
+    with ProcessHistory(path=path, profile=outdated) as history:
+        assert not history.is_processed(digest="abc", today=100)
+
+
+def test_process_comic_retries_unmatched_sync(comic: Comic, tmp_path: Path) -> None:
+    today = date(2024, 2, 1).toordinal()
+    with (
+        ProcessHistory(path=tmp_path / "history.sqlite", profile="outdated") as history,
+        patch("perdoo.cli._sync.sync_metadata", return_value=(None, None)) as sync_metadata,
+    ):
+        run_process_comic(comic=comic, history=history, today=today)
+        run_process_comic(comic=comic, history=history, today=today)
+
+        assert sync_metadata.call_count == 2
+        assert not history.is_processed(digest=file_digest(filepath=comic.filepath), today=today)
+
+
+def test_process_comic_records_synced_metadata(comic: Comic, tmp_path: Path) -> None:
+    last_modified = datetime(2024, 1, 20)
+    metron_info = MetronInfo(series=Series(name="Example"), last_modified=last_modified)
+    today = date(2024, 2, 1).toordinal()
+    with (
+        ProcessHistory(path=tmp_path / "history.sqlite", profile="outdated") as history,
+        patch("perdoo.cli._sync.sync_metadata", return_value=(metron_info, None)),
+    ):
+        run_process_comic(comic=comic, history=history, today=today)
+
+        digest = file_digest(filepath=comic.filepath)
+        assert history.is_processed(digest=digest, today=today)
+        assert not history.is_processed(digest=digest, today=last_modified.toordinal() + 28)
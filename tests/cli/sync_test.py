@@ -0,0 +1,88 @@
+from datetime import date, datetime
+
+import pytest
+
+from perdoo.cli._sync import (
+    SyncOption,
+    search_from_comic_info,
+    search_from_filename,
+    search_from_metron_info,
+    should_sync_metadata,
+)
+from perdoo.comic.metadata import ComicInfo, MetronInfo
+from perdoo.comic.metadata.metron_info import Id, InformationSource, Series
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("Force", SyncOption.FORCE), ("outdated", SyncOption.OUTDATED), ("SKIP", SyncOption.SKIP)],
+)
+def test_sync_option_load(value: str, expected: SyncOption) -> None:
+    assert SyncOption.load(value=value) is expected
+
+
+def test_sync_option_load_invalid() -> None:
+    with pytest.raises(ValueError, match=r"isn't a valid SyncOption"):
+        SyncOption.load(value="Sometimes")
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("The Amazing Spider-Man v2 #001 (1963)", "The Amazing Spider Man"),
+        ("Saga 54", "Saga"),
+        ("Batman_001_(2016)", "Batman"),
+        ("Series Name (2019)", "Series Name"),
+    ],
+)
+def test_search_from_filename(filename: str, expected: str) -> None:
+    assert search_from_filename(filename=filename).series.name == expected
+
+
+def test_search_from_metron_info() -> None:
+    metron_info = MetronInfo(
+        ids=[
+            Id(source=InformationSource.COMIC_VINE, value="123"),
+            Id(primary=True, source=InformationSource.METRON, value="456"),
+            Id(source=InformationSource.METRON, value="789"),
+        ],
+        series=Series(id="10", name="Test Series", volume=2),
+        number="5",
+    )
+    search = search_from_metron_info(metron_info=metron_info, filename="sample")
+
+    assert search.series.metron == 10
+    assert search.series.comicvine is None
+    assert search.issue.comicvine == 123
+    assert search.issue.metron == 456
+
+
+@pytest.mark.parametrize(
+    ("value", "volume", "year"),
+    [(None, None, None), (2, 2, None), (1900, 1900, None), (2015, None, 2015)],
+)
+def test_search_from_comic_info(value: int | None, volume: int | None, year: int | None) -> None:
+    comic_info = ComicInfo(series="Test Series", volume=value, number="1")
+    search = search_from_comic_info(comic_info=comic_info, filename="sample")
+
+    assert search.series.volume == volume
+    assert search.series.year == year
+
+
+@pytest.mark.parametrize(
+    ("sync", "last_modified", "expected"),
+    [
+        (SyncOption.SKIP, None, False),
+        (SyncOption.FORCE, datetime(2024, 1, 30), True),
+        (SyncOption.OUTDATED, None, True),
+        (SyncOption.OUTDATED, datetime(2024, 1, 4, 23, 59), True),
+        (SyncOption.OUTDATED, datetime(2024, 1, 5), False),
+    ],
+)
+def test_should_sync_metadata(
+    sync: SyncOption, last_modified: datetime | None, expected: bool
+) -> None:
+    metron_info = MetronInfo(series=Series(name="Test Series"), last_modified=last_modified)
+    today = date(2024, 2, 1).toordinal()
+
+    assert should_sync_metadata(sync=sync, metron_info=metron_info, today=today) is expected
@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import ClassVar
+from unittest.mock import patch
 
 import pytest
 
@@ -14,6 +15,11 @@ def test_load_selects_cbz(cbz_path: Path) -> None:
     assert loaded.filepath == cbz_path
 
 
+def test_load_only_probes_matching_extension(cbz_path: Path) -> None:
+    with patch.object(CBTArchive, "is_archive", side_effect=AssertionError):
+        assert isinstance(Archive.load(filepath=cbz_path), CBZArchive)
+
+
 def test_load_selects_cbt(cbt_path: Path) -> None:
     loaded = Archive.load(filepath=cbt_path)
 
@@ -29,6 +35,27 @@ def test_load_unsupported(tmp_path: Path) -> None:
         Archive.load(filepath=tmp)
 
 
+def test_has_magic(cbz_path: Path, cbt_path: Path) -> None:
+    assert CBZArchive.has_magic(path=cbz_path)
+    assert not CBTArchive.has_magic(path=cbz_path)
+    assert not CBZArchive.has_magic(path=cbt_path)
+
+
+def test_load_mismatched_content(tmp_path: Path) -> None:
+    tmp = tmp_path / "sample.cbz"
+    tmp.write_bytes(b"Not a zip")
+
+    with pytest.raises(ComicArchiveError, match=r"Unsupported archive format"):
+        Archive.load(filepath=tmp)
+
+
+def test_scratch_folder(tmp_path: Path, cbz_archive: CBZArchive) -> None:
+    with patch("perdoo.comic.archives._base.SHM_FOLDER", tmp_path / "missing"):
+        assert cbz_archive.scratch_folder() == cbz_archive.filepath.parent
+    with patch("perdoo.comic.archives._base.SHM_FOLDER", tmp_path):
+        assert cbz_archive.scratch_folder() == tmp_path
+
+
 def test_default_operations(tmp_path: Path, cbz_archive: CBZArchive) -> None:
     class DummyArchive(Archive):
         EXTENSION: ClassVar[str] = ".xyz"
@@ -40,10 +67,10 @@ def test_default_operations(tmp_path: Path, cbz_archive: CBZArchive) -> None:
         def is_archive(cls, path: Path) -> bool:  # noqa: ARG003
             return False
 
-        def list_filenames(self) -> list[str]:
+        def _list_filenames(self) -> list[str]:
             return []
 
-        def extract_files(self, destination: Path) -> None:  # noqa: ARG002
+        def extract_files(self, destination: Path, workers: int = 1) -> None:  # noqa: ARG002
             return None
 
     tmp = DummyArchive(filepath=tmp_path / "sample.xyz")
@@ -57,5 +84,9 @@ def test_default_operations(tmp_path: Path, cbz_archive: CBZArchive) -> None:
         tmp.rename_file(filename="info.txt", new_name="new.txt")
     with pytest.raises(ComicArchiveError, match=r"Unable to archive"):
         DummyArchive.archive_files(src=tmp_path, output_name="sample", files=[])
+    with pytest.raises(ComicArchiveError, match=r"Unable to stream"):
+        tmp.iter_members()
+    with pytest.raises(ComicArchiveError, match=r"Unable to archive"):
+        DummyArchive.archive_members(folder=tmp_path, output_name="sample", members=iter([]))
     with pytest.raises(ComicArchiveError, match=r"Unable to convert"):
         DummyArchive.convert_from(old_archive=cbz_archive)
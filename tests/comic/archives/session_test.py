@@ -1,4 +1,8 @@
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
+from zipremove import ZipFile
 
 from perdoo.comic.archives import ArchiveSession, CBTArchive, CBZArchive
 from perdoo.comic.errors import ComicArchiveError
@@ -30,15 +34,97 @@ def test_non_editable_session(cbt_archive: CBTArchive) -> None:
         session.rename(filename="src.txt", new_name="new.txt")
         session.delete(filename="001.jpg")
 
-        # TODO: assert cbt_archive.read_file(filename="info.txt") != b"Updated data"
+        assert session.read(filename="info.txt") == b"Updated data"
+        assert cbt_archive.read_file(filename="info.txt") == b"Fake data"
         assert "001.jpg" in cbt_archive.list_filenames()
         assert "src.txt" not in cbt_archive.list_filenames()
         assert "new.txt" not in cbt_archive.list_filenames()
 
 
+def test_non_editable_session_extracts_on_write(cbt_archive: CBTArchive) -> None:
+    with ArchiveSession(archive=cbt_archive) as session:
+        with patch.object(CBTArchive, "extract_files", side_effect=AssertionError):
+            assert session.contains(filename="info.txt")
+            assert not session.contains(filename="new.txt")
+            assert session.read_files(filenames=["info.txt"]) == {"info.txt": b"Fake data"}
+
+        session.write(filename="new.txt", data=b"Hello World")
+        assert session.contains(filename="new.txt")
+        assert session.read(filename="info.txt") == b"Fake data"
+
+
+def test_nested_session(cbt_archive: CBTArchive) -> None:
+    session = ArchiveSession(archive=cbt_archive)
+    with session:
+        session.write(filename="new.txt", data=b"Hello World")
+        with session:
+            session.write(filename="info.txt", data=b"Updated data")
+        assert "new.txt" not in cbt_archive.list_filenames()
+        assert session.read(filename="new.txt") == b"Hello World"
+
+    assert session.archive.read_file(filename="new.txt") == b"Hello World"
+    assert session.archive.read_file(filename="info.txt") == b"Updated data"
+
+
+def test_session_repacks_next_to_archive(cbt_archive: CBTArchive, tmp_path: Path) -> None:
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    with (
+        patch("perdoo.comic.archives._base.SHM_FOLDER", scratch),
+        patch.object(
+            CBTArchive, "archive_files", side_effect=CBTArchive.archive_files
+        ) as archive_files,
+        ArchiveSession(archive=cbt_archive) as session,
+    ):
+        session.write(filename="info.txt", data=b"Updated data")
+        assert scratch in session._folder.parents  # noqa: SLF001
+
+    assert archive_files.call_args.kwargs["output_folder"].parent == cbt_archive.filepath.parent
+    assert list(scratch.iterdir()) == []
+    assert cbt_archive.read_file(filename="info.txt") == b"Updated data"
+
+
 def test_session_rename_raises_exception(cbz_archive: CBZArchive) -> None:
     with ArchiveSession(cbz_archive) as session:
         with pytest.raises(ComicArchiveError, match=r"Unable to rename"):
             session.rename(filename="new.txt", new_name="info.txt")
         with pytest.raises(ComicArchiveError, match=r"Unable to rename"):
             session.rename(filename="info.txt", new_name="001.jpg", override=False)
+
+
+def test_session_skips_repack_on_error(cbz_archive: CBZArchive) -> None:
+    def update() -> None:
+        with ArchiveSession(archive=cbz_archive) as session:
+            session.delete(filename="001.jpg")
+            raise ValueError("Interrupted")
+
+    with patch.object(ZipFile, "repack") as repack, pytest.raises(ValueError, match=r"Interrupted"):
+        update()
+
+    repack.assert_not_called()
+    assert cbz_archive.read_file(filename="info.txt") == b"Fake data"
+
+
+def test_converting_session(cbz_archive: CBZArchive, tmp_path: Path) -> None:
+    with ArchiveSession(archive=cbz_archive, output=CBTArchive) as session:
+        session.write(filename="info.txt", data="Updated data")
+        session.delete(filename="001.jpg")
+
+    assert isinstance(session.archive, CBTArchive)
+    assert session.archive.filepath == cbz_archive.filepath.with_suffix(".cbt")
+    assert not cbz_archive.filepath.exists()
+    assert "001.jpg" not in session.archive.list_filenames()
+    session.archive.extract_files(destination=tmp_path / "output")
+    assert (tmp_path / "output" / "info.txt").read_bytes() == b"Updated data"
+
+
+def test_converting_session_passes_workers(cbz_archive: CBZArchive) -> None:
+    with (
+        patch.object(
+            CBZArchive, "extract_files", autospec=True, side_effect=CBZArchive.extract_files
+        ) as extract_files,
+        ArchiveSession(archive=cbz_archive, output=CBTArchive, workers=2) as session,
+    ):
+        assert session.read(filename="info.txt") == b"Fake data"
+
+    assert extract_files.call_args.kwargs["workers"] == 2
@@ -3,7 +3,7 @@ from pathlib import Path
 import pytest
 
 from perdoo.comic.archives import CB7Archive, CBZArchive
-from perdoo.comic.archives.sevenzip import PY7ZR_AVAILABLE
+from perdoo.comic.archives.sevenzip import PY7ZR_AVAILABLE, _select_filters
 from perdoo.comic.errors import ComicArchiveError
 from perdoo.utils import list_files
 
@@ -23,6 +23,22 @@ def test_read_file(cb7_archive: CB7Archive) -> None:
     assert cb7_archive.read_file(filename="001.jpg") == b"Fake image"
 
 
+def test_read_files(cb7_archive: CB7Archive) -> None:
+    assert cb7_archive.read_files(filenames=["info.txt", "001.jpg"]) == {
+        "info.txt": b"Fake data",
+        "001.jpg": b"Fake image",
+    }
+    with pytest.raises(ComicArchiveError, match=r"Unable to read"):
+        cb7_archive.read_files(filenames=["missing.txt"])
+
+
+def test_batch_read_file(cb7_archive: CB7Archive) -> None:
+    with cb7_archive.batch():
+        assert cb7_archive.read_file(filename="info.txt") == b"Fake data"
+        assert cb7_archive.read_file(filename="001.jpg") == b"Fake image"
+        assert set(cb7_archive.list_filenames()) == {"info.txt", "001.jpg"}
+
+
 def test_unsupported_functions(cb7_archive: CB7Archive) -> None:
     with pytest.raises(ComicArchiveError, match=r"Unable to write"):
         cb7_archive.write_file(filename="info.txt", data=b"Updated data")
@@ -52,6 +68,35 @@ def test_archive_files(cb7_archive: CB7Archive, tmp_path: Path) -> None:
     assert cb7_archive.filepath == archive
 
 
+def test_select_filters(tmp_path: Path) -> None:
+    import py7zr  # noqa: PLC0415
+
+    image = tmp_path / "001.jpg"
+    image.write_bytes(b"\xff" * 1000)
+    metadata = tmp_path / "ComicInfo.xml"
+    metadata.write_bytes(b"<ComicInfo />")
+
+    assert _select_filters(files=[image, metadata])[0]["id"] == py7zr.FILTER_COPY
+    assert _select_filters(files=[metadata])[0]["id"] == py7zr.FILTER_LZMA2
+
+
+def test_archive_files_without_compression(src: Path) -> None:
+    import py7zr  # noqa: PLC0415
+
+    image = src / "001.jpg"
+    image.write_bytes(bytes(range(256)) * 40)
+    metadata = src / "ComicInfo.xml"
+    metadata.write_bytes(b"<ComicInfo />")
+    filepath = CB7Archive.archive_files(src=src, output_name="sample", files=[image, metadata])
+
+    with py7zr.SevenZipFile(filepath, "r") as archive:
+        assert archive.archiveinfo().method_names == ["COPY"]
+    archive = CB7Archive(filepath=filepath)
+    assert archive.read_file(filename="001.jpg") == image.read_bytes()
+    archive.extract_files(destination=src.parent / "out")
+    assert (src.parent / "out" / "ComicInfo.xml").read_bytes() == b"<ComicInfo />"
+
+
 def test_convert_from(cbz_archive: CBZArchive) -> None:
     old_filenames = cbz_archive.list_filenames()
     archive = CB7Archive.convert_from(old_archive=cbz_archive)
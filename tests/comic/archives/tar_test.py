@@ -1,8 +1,14 @@
+import gzip
+import tarfile
+import time
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
+from zipremove import ZipFile, ZipInfo
 
-from perdoo.comic.archives import CBTArchive, CBZArchive
+from perdoo.comic.archives import CBTArchive, CBZArchive, tar
 from perdoo.comic.errors import ComicArchiveError
 from perdoo.utils import list_files
 
@@ -15,9 +21,35 @@ def test_list_filenames(cbt_archive: CBTArchive) -> None:
     assert set(cbt_archive.list_filenames()) == {"info.txt", "001.jpg"}
 
 
-def test_unsupported_functions(cbt_archive: CBTArchive) -> None:
+def test_read_file(cbt_archive: CBTArchive) -> None:
+    assert cbt_archive.read_file(filename="info.txt") == b"Fake data"
     with pytest.raises(ComicArchiveError, match=r"Unable to read"):
-        cbt_archive.read_file(filename="info.txt")
+        cbt_archive.read_file(filename="missing.txt")
+
+
+def test_read_files(cbt_archive: CBTArchive) -> None:
+    assert cbt_archive.read_files(filenames=["info.txt", "001.jpg"]) == {
+        "info.txt": b"Fake data",
+        "001.jpg": b"Fake image",
+    }
+
+
+def test_read_gzip_with_isal(src: Path, archive_files: dict[str, bytes]) -> None:
+    filepath = src.parent / "sample.cbt"
+    with tarfile.open(name=filepath, mode="w:gz") as archive:
+        for filename, data in archive_files.items():
+            (src / filename).write_bytes(data)
+            archive.add(src / filename, arcname=filename)
+    igzip = SimpleNamespace(IGzipFile=MagicMock(side_effect=gzip.GzipFile))
+    with (
+        patch.object(tar, "ISAL_AVAILABLE", new=True),
+        patch.object(tar, "igzip", new=igzip, create=True),
+    ):
+        assert CBTArchive(filepath=filepath).read_file(filename="001.jpg") == b"Fake image"
+    igzip.IGzipFile.assert_called_once_with(filepath, "rb")
+
+
+def test_unsupported_functions(cbt_archive: CBTArchive) -> None:
     with pytest.raises(ComicArchiveError, match=r"Unable to write"):
         cbt_archive.write_file(filename="info.txt", data=b"Updated data")
     with pytest.raises(ComicArchiveError, match=r"Unable to delete"):
@@ -44,6 +76,8 @@ def test_archive_files(cbt_archive: CBTArchive, tmp_path: Path) -> None:
     )
 
     assert cbt_archive.filepath == archive
+    assert CBTArchive.has_magic(path=archive)
+    assert CBTArchive(filepath=archive).read_file(filename="001.jpg") == b"Fake image"
 
 
 def test_convert_from(cbz_archive: CBZArchive) -> None:
@@ -55,4 +89,37 @@ def test_convert_from(cbz_archive: CBZArchive) -> None:
     assert archive.filepath.exists()
     assert not cbz_archive.filepath.exists()
     assert archive.list_filenames() == old_filenames
-    # TODO: assert archive.read_file(filename="info.txt") == b"Fake data"
+    assert archive.read_file(filename="info.txt") == b"Fake data"
+
+
+def test_convert_from_flattens_members(tmp_path: Path) -> None:
+    filepath = tmp_path / "nested.cbz"
+    with ZipFile(filepath, "w") as archive:
+        archive.writestr("pages/", "")
+        archive.writestr("pages/001.jpg", "Page 1")
+        archive.writestr("pages/.hidden", "Hidden")
+        archive.writestr("info.txt", "Fake data")
+    archive = CBTArchive.convert_from(old_archive=CBZArchive(filepath=filepath))
+
+    assert set(archive.list_filenames()) == {"001.jpg", "info.txt"}
+    archive.extract_files(destination=tmp_path / "out")
+    assert (tmp_path / "out" / "001.jpg").read_text(encoding="UTF-8") == "Page 1"
+
+
+def test_convert_from_keeps_mtime(tmp_path: Path) -> None:
+    filepath = tmp_path / "sample.cbz"
+    with ZipFile(filepath, "w") as archive:
+        archive.writestr(ZipInfo(filename="001.jpg", date_time=(2001, 2, 3, 4, 5, 6)), "Page 1")
+    archive = CBTArchive.convert_from(old_archive=CBZArchive(filepath=filepath))
+
+    with tarfile.open(name=archive.filepath) as tar_file:
+        assert tar_file.getmember("001.jpg").mtime == time.mktime((2001, 2, 3, 4, 5, 6, 0, 0, -1))
+
+
+def test_batch_caches_filenames(cbt_archive: CBTArchive) -> None:
+    with cbt_archive.batch():
+        filenames = cbt_archive.list_filenames()
+        filenames.append("mutated.txt")
+        with patch.object(CBTArchive, "_list_filenames", side_effect=AssertionError):
+            assert set(cbt_archive.list_filenames()) == {"info.txt", "001.jpg"}
+    assert set(cbt_archive.list_filenames()) == {"info.txt", "001.jpg"}
@@ -1,6 +1,11 @@
+import tarfile
+import time
+from io import BytesIO
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from zipremove import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from perdoo.comic.archives import CBTArchive, CBZArchive
 from perdoo.comic.errors import ComicArchiveError
@@ -20,6 +25,13 @@ def test_read_file(cbz_archive: CBZArchive) -> None:
     assert cbz_archive.read_file(filename="001.jpg") == b"Fake image"
 
 
+def test_read_files(cbz_archive: CBZArchive) -> None:
+    assert cbz_archive.read_files(filenames=["info.txt", "001.jpg"]) == {
+        "info.txt": b"Fake data",
+        "001.jpg": b"Fake image",
+    }
+
+
 def test_write_file(cbz_archive: CBZArchive) -> None:
     cbz_archive.write_file(filename="info.txt", data=b"Updated data")
     assert cbz_archive.read_file(filename="info.txt") == b"Updated data"
@@ -29,6 +41,11 @@ def test_write_file(cbz_archive: CBZArchive) -> None:
     assert "new.txt" in cbz_archive.list_filenames()
     assert cbz_archive.read_file(filename="new.txt") == b"Hello World"
 
+    cbz_archive.write_file(filename="002.jpg", data=b"Fake image")
+    with ZipFile(cbz_archive.filepath, "r") as zip_file:
+        assert zip_file.getinfo("new.txt").compress_type == ZIP_DEFLATED
+        assert zip_file.getinfo("002.jpg").compress_type == ZIP_STORED
+
 
 def test_delete_file(cbz_archive: CBZArchive) -> None:
     assert "info.txt" in cbz_archive.list_filenames()
@@ -61,6 +78,53 @@ def test_extract_files(cbz_archive: CBZArchive, tmp_path: Path) -> None:
     assert (dest / "001.jpg").read_bytes() == b"Fake image"
 
 
+def test_extract_files_in_parallel(tmp_path: Path) -> None:
+    filepath = tmp_path / "nested.cbz"
+    with ZipFile(filepath, "w") as archive:
+        for index in range(10):
+            archive.writestr(f"pages/{index:03}.jpg", f"Page {index}")
+    dest = tmp_path / "out"
+    with patch.object(
+        CBZArchive,
+        "_extract_members",
+        autospec=True,
+        side_effect=CBZArchive._extract_members,  # noqa: SLF001
+    ) as extract_members:
+        CBZArchive(filepath=filepath).extract_files(destination=dest, workers=4)
+
+    assert extract_members.call_count == 4
+    assert len(list_files(path=dest)) == 10
+    assert (dest / "pages" / "009.jpg").read_text(encoding="UTF-8") == "Page 9"
+
+
+def test_extract_files_sequentially_by_default(tmp_path: Path) -> None:
+    filepath = tmp_path / "sample.cbz"
+    with ZipFile(filepath, "w") as archive:
+        for index in range(10):
+            archive.writestr(f"{index:03}.jpg", f"Page {index}")
+    dest = tmp_path / "out"
+    with patch.object(CBZArchive, "_extract_members") as extract_members:
+        CBZArchive(filepath=filepath).extract_files(destination=dest)
+
+    extract_members.assert_not_called()
+    assert len(list_files(path=dest)) == 10
+
+
+def test_extract_files_in_parallel_stays_in_destination(tmp_path: Path) -> None:
+    filepath = tmp_path / "unsafe.cbz"
+    with ZipFile(filepath, "w") as archive:
+        for index in range(4):
+            archive.writestr(f"../pages/{index:03}.jpg", f"Page {index}")
+            archive.writestr(f"/root/{index:03}.jpg", f"Page {index}")
+    dest = tmp_path / "out"
+    CBZArchive(filepath=filepath).extract_files(destination=dest, workers=4)
+
+    assert len(list_files(path=dest)) == 8
+    assert (dest / "pages" / "003.jpg").read_text(encoding="UTF-8") == "Page 3"
+    assert (dest / "root" / "003.jpg").read_text(encoding="UTF-8") == "Page 3"
+    assert not (tmp_path / "pages").exists()
+
+
 def test_archive_files(cbz_archive: CBZArchive, tmp_path: Path) -> None:
     dest = tmp_path / "out"
     dest.mkdir(parents=True, exist_ok=True)
@@ -70,6 +134,9 @@ def test_archive_files(cbz_archive: CBZArchive, tmp_path: Path) -> None:
     )
 
     assert cbz_archive.filepath == archive
+    with ZipFile(archive, "r") as zip_file:
+        assert zip_file.getinfo("001.jpg").compress_type == ZIP_STORED
+        assert zip_file.getinfo("info.txt").compress_type == ZIP_DEFLATED
 
 
 def test_convert_from(cbt_archive: CBTArchive) -> None:
@@ -82,3 +149,78 @@ def test_convert_from(cbt_archive: CBTArchive) -> None:
     assert not cbt_archive.filepath.exists()
     assert archive.list_filenames() == old_filenames
     assert archive.read_file(filename="info.txt") == b"Fake data"
+
+
+def test_convert_from_keeps_mtime(tmp_path: Path) -> None:
+    filepath = tmp_path / "sample.cbt"
+    with tarfile.open(name=filepath, mode="w") as tar_file:
+        for filename in ("001.jpg", "info.txt"):
+            info = tarfile.TarInfo(name=filename)
+            info.size = 4
+            info.mtime = int(time.mktime((2001, 2, 3, 4, 5, 6, 0, 0, -1)))
+            tar_file.addfile(info, fileobj=BytesIO(b"Data"))
+    archive = CBZArchive.convert_from(old_archive=CBTArchive(filepath=filepath))
+
+    with ZipFile(archive.filepath, "r") as zip_file:
+        for filename, compress_type in (("001.jpg", ZIP_STORED), ("info.txt", ZIP_DEFLATED)):
+            info = zip_file.getinfo(filename)
+            assert info.date_time == (2001, 2, 3, 4, 5, 6)
+            assert info.compress_type == compress_type
+            assert zip_file.read(filename) == b"Data"
+
+
+def test_batch(cbz_archive: CBZArchive) -> None:
+    with cbz_archive.batch():
+        cbz_archive.write_file(filename="info.txt", data=b"Updated data")
+        cbz_archive.write_file(filename="info.txt", data=b"Updated again")
+        cbz_archive.rename_file(filename="001.jpg", new_name="002.jpg")
+        cbz_archive.write_file(filename="new.txt", data=b"Hello World")
+        cbz_archive.delete_file(filename="new.txt")
+        assert cbz_archive.read_file(filename="info.txt") == b"Updated again"
+        assert set(cbz_archive.list_filenames()) == {"info.txt", "002.jpg"}
+
+    with ZipFile(file=cbz_archive.filepath, mode="r") as archive:
+        assert archive.testzip() is None
+    assert set(cbz_archive.list_filenames()) == {"info.txt", "002.jpg"}
+    assert cbz_archive.read_file(filename="info.txt") == b"Updated again"
+    assert cbz_archive.read_file(filename="002.jpg") == b"Fake image"
+
+
+def test_batch_skips_repack_on_error(cbz_archive: CBZArchive) -> None:
+    def update() -> None:
+        with cbz_archive.batch():
+            cbz_archive.delete_file(filename="001.jpg")
+            raise ValueError("Interrupted")
+
+    with patch.object(ZipFile, "repack") as repack, pytest.raises(ValueError, match=r"Interrupted"):
+        update()
+
+    repack.assert_not_called()
+    assert cbz_archive.read_file(filename="info.txt") == b"Fake data"
+
+
+def test_batch_read_then_write(cbz_archive: CBZArchive) -> None:
+    with cbz_archive.batch():
+        assert cbz_archive.read_file(filename="info.txt") == b"Fake data"
+        cbz_archive.write_file(filename="info.txt", data=b"Updated data")
+        assert cbz_archive.read_file(filename="info.txt") == b"Updated data"
+
+    assert cbz_archive.read_file(filename="info.txt") == b"Updated data"
+
+
+def test_batch_refreshes_filenames(cbz_archive: CBZArchive) -> None:
+    with cbz_archive.batch():
+        assert set(cbz_archive.list_filenames()) == {"info.txt", "001.jpg"}
+        cbz_archive.write_file(filename="new.txt", data=b"Hello World")
+        assert set(cbz_archive.list_filenames()) == {"info.txt", "001.jpg", "new.txt"}
+
+
+def test_exists(cbz_archive: CBZArchive) -> None:
+    assert cbz_archive.exists(filename="info.txt")
+    assert not cbz_archive.exists(filename="new.txt")
+    with cbz_archive.batch():
+        assert not cbz_archive.exists(filename="new.txt")
+        cbz_archive.write_file(filename="new.txt", data=b"Hello World")
+        assert cbz_archive.exists(filename="new.txt")
+        cbz_archive.delete_file(filename="info.txt")
+        assert not cbz_archive.exists(filename="info.txt")
@@ -1,11 +1,14 @@
-from unittest.mock import MagicMock
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
+from PIL import Image
 
-from perdoo.cli.process import generate_naming
+from perdoo.cli.process import generate_naming, load_page_info
 from perdoo.comic.archives import CBTArchive, CBZArchive
 from perdoo.comic.comic import Comic
 from perdoo.comic.metadata import ComicInfo, MetronInfo
+from perdoo.comic.metadata.comic_info import PageType
 
 
 @pytest.fixture
@@ -76,7 +79,47 @@ def test_write_metadata_override(cbz_comic: Comic, metron_info: MetronInfo) -> N
         assert info == metadata_copy
 
 
+def test_load_page_info(tmp_path: Path, comic_info: ComicInfo) -> None:
+    src = tmp_path / "pages"
+    src.mkdir()
+    files = []
+    for filename, size in (("002.png", (20, 10)), ("003.png", (10, 20)), ("001.png", (10, 20))):
+        Image.new("RGB", size).save(src / filename)
+        files.append(src / filename)
+    comic = Comic(filepath=CBTArchive.archive_files(src=src, output_name="pages", files=files))
+    comic_info.pages = []
+
+    with comic.open_session() as session:
+        load_page_info(entry=comic, session=session, comic_info=comic_info)
+
+    assert [x.image for x in comic_info.pages] == [0, 1, 2]
+    assert [x.type for x in comic_info.pages] == [
+        PageType.FRONT_COVER,
+        PageType.STORY,
+        PageType.BACK_COVER,
+    ]
+    assert [x.double_page for x in comic_info.pages] == [False, True, False]
+    assert comic_info.pages[1].image_size == (src / "002.png").stat().st_size
+
+
 def test_rename(cbz_comic: Comic, metron_info: MetronInfo) -> None:
     naming = generate_naming(metron_info=metron_info, comic_info=None)
     cbz_comic.move_to(naming=naming, output_folder=cbz_comic.filepath.parent)
     assert cbz_comic.filepath.name == "Test-Series-v1_#.cbz"
+
+
+def test_read_metadata_single_pass(
+    tmp_path: Path, comic_info: ComicInfo, metron_info: MetronInfo
+) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    files = [src / ComicInfo.FILENAME, src / MetronInfo.FILENAME]
+    files[0].write_bytes(comic_info.to_bytes())
+    files[1].write_bytes(metron_info.to_bytes())
+    comic = Comic(filepath=CBTArchive.archive_files(src=src, output_name="sample", files=files))
+
+    with (
+        comic.open_session() as session,
+        patch.object(CBTArchive, "read_file", side_effect=AssertionError),
+    ):
+        assert comic.read_metadata(session=session) == (metron_info, comic_info)
@@ -1,8 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
 from perdoo.comic.metadata import ComicInfo
-from perdoo.comic.metadata._base import sanitize
+from perdoo.comic.metadata._base import _compile_pattern, _xml_parser, sanitize
 from perdoo.settings import Naming, Output, Settings
 
 
@@ -17,6 +18,13 @@ def test_sanitize_none_and_empty() -> None:
     assert sanitize(value="", seperator="-") == ""
 
 
+def test_xml_parser_per_thread() -> None:
+    parser = _xml_parser()
+    assert _xml_parser() is parser
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_xml_parser).result() is not parser
+
+
 def test_evaluate_pattern() -> None:
     obj = ComicInfo(series="Series", volume=1, number=2, format="Single Issue", publisher="Pub")
     settings = Settings(
@@ -40,3 +48,11 @@ def test_metadata_to_file(tmp_path: Path) -> None:
     assert loaded.series == "Example"
     assert loaded.number == "1"
     assert loaded.format == "Single Issue"
+
+
+def test_compile_pattern() -> None:
+    assert _compile_pattern(pattern="Comics/{series-name}_#{number:3}.cbz") == (
+        ("Comics/", "series-name", None),
+        ("_#", "number", "3"),
+        (".cbz", None, None),
+    )